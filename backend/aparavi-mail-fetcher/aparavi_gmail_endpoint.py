@@ -4,12 +4,49 @@ This is a placeholder implementation that simulates fetching Gmail data through
 NOT INTEGRATED - For demonstration purposes only.
 """
 
-from flask import Flask, jsonify, request
+from cachetools import TTLCache
+from quart import Blueprint, Quart, Response, request
+from quart.json.provider import DefaultJSONProvider
+from quart_compress import Compress
 from datetime import datetime
-import json
+import asyncio
+import importlib.util
+import mmap
+import msgpack
+import orjson
 import os
+import time
+import weakref
 
-app = Flask(__name__)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson instead of the stdlib encoder"""
+
+    # Never pretty-print or sort keys, even when the app runs in debug mode
+    compact = True
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
+app.url_map.strict_slashes = False
+
+bp = Blueprint('aparavi', __name__)
+
+# Reject oversized request bodies before they are parsed
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+
+# Compress JSON/MessagePack bodies for clients that send Accept-Encoding
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'application/msgpack']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
 
 # Dummy configuration - would normally come from .env
 APARAVI_CONFIG = {
@@ -23,9 +60,143 @@ PIPELINE_CONFIG_PATH = os.path.join(
     "aparavi-project-export-new-project-2025-10-04T17-32.json"
 )
 
+# Response timestamps are cached at 100ms granularity
+_TIMESTAMP_RESOLUTION = 0.1
+_TS = {"v": "", "t": 0.0}
+
+
+def _now_iso():
+    """Return the current UTC time in ISO format, reformatted at most every 100ms"""
+    t = time.time()
+    if t - _TS["t"] > _TIMESTAMP_RESOLUTION:
+        _TS["v"] = datetime.utcfromtimestamp(t).isoformat()
+        _TS["t"] = t
+    return _TS["v"]
+
+
+async def _read_json_body():
+    """Parse the JSON request body, skipping the parser entirely for empty bodies"""
+    # content_length is None for chunked uploads, so only an explicit 0 short-circuits
+    if request.content_length == 0:
+        return {}
+    body = await request.get_data(cache=False)
+    if not body:
+        return {}
+    try:
+        return orjson.loads(body) or {}
+    except orjson.JSONDecodeError:
+        return {}
+
+
+def _json_response(obj, status=200):
+    """Wrap orjson's bytes output directly, bypassing jsonify"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
+def _negotiated_response(response):
+    """Return MessagePack when the client asks for it, JSON otherwise"""
+    if 'application/msgpack' in request.headers.get('Accept', ''):
+        body = msgpack.packb(response, use_bin_type=True)
+        return Response(body, status=200, mimetype='application/msgpack')
+    return _json_response(response)
+
+
+def _load_pipeline_config():
+    """Parse the static pipeline export once and precompute its component summary"""
+    # orjson parses straight from the read-only mapping, avoiding a bytes copy
+    with open(PIPELINE_CONFIG_PATH, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view:
+        config = orjson.loads(view)
+    summary = [
+        {
+            "id": comp.get("id"),
+            "provider": comp.get("provider"),
+            "valid": True
+        } for comp in config.get("components", [])
+    ]
+    return config, summary
+
+
+try:
+    _PIPELINE_CONFIG, _PIPELINE_COMPONENTS_SUMMARY = _load_pipeline_config()
+    _PIPELINE_CONFIG_ERROR = None
+except (OSError, ValueError) as e:
+    # Surface the failure from validate_pipeline instead of breaking import
+    _PIPELINE_CONFIG, _PIPELINE_COMPONENTS_SUMMARY = None, None
+    _PIPELINE_CONFIG_ERROR = e
+
+# Per-email strings, formatted in a single format_map call and split apart
+_EMAIL_FIELDS_TEMPLATE = (
+    "Insurance Claim #{n}"
+    "|This is a simulated email body for claim #{n}"
+    "|claim_document_{n}.pdf"
+    "|CLM-{n}"
+)
+
+
+def _build_email_template(n):
+    subject, body_preview, filename, claim_number = (
+        _EMAIL_FIELDS_TEMPLATE.format_map({"n": n}).split("|")
+    )
+    return {
+        "id": "email_001",
+        "from": None,
+        "subject": subject,
+        "date": "2024-10-01T10:30:00Z",
+        "body_preview": body_preview,
+        "attachments": [
+            {
+                "filename": filename,
+                "size": 245678,
+                "mime_type": "application/pdf"
+            }
+        ],
+        "parsed_data": {
+            "claim_number": claim_number,
+            "claim_type": "auto",
+            "status": "pending"
+        }
+    }
+
+
+# Simulated emails are identical on every request except for the sender,
+# so build them once and only splice in "from" per request
+_EMAIL_TEMPLATES = tuple(_build_email_template(i + 1001) for i in range(3))
+
+# Pre-serialized fragments for responses whose only variable fields are the
+# token and timestamp; the token is embedded via orjson.dumps for escaping
+_HEALTH_PREFIX = (
+    b'{"status":"healthy","service":"Aparavi Gmail Fetcher (DUMMY)",'
+    b'"version":"1.0.0-placeholder","timestamp":"'
+)
+_HEALTH_SUFFIX = b'"}'
+
+_STATUS_PREFIX = (
+    b'{"status":"success","message":"Pipeline status retrieved (DUMMY)",'
+    b'"data":{"token":'
+)
+_STATUS_MIDDLE = (
+    b',"state":"completed","progress":100,"results":'
+    b'{"emails_processed":3,"documents_parsed":3,"errors":0}},"timestamp":"'
+)
+_STATUS_SUFFIX = b'"}'
+
+# Clients poll status every 1-2s; serve repeated polls for a token from cache.
+# Per-token locks keep concurrent misses from all building the same response.
+_STATUS_CACHE = TTLCache(maxsize=4096, ttl=1.0)
+_STATUS_LOCKS = weakref.WeakValueDictionary()
+
+_TEARDOWN_PREFIX = (
+    b'{"status":"success","message":"Pipeline resources cleaned up (DUMMY)",'
+    b'"data":{"token":'
+)
+_TEARDOWN_MIDDLE = b',"resources_freed":true},"timestamp":"'
+_TEARDOWN_SUFFIX = b'"}'
 
-@app.route('/aparavi/gmail/fetch', methods=['POST'])
-def fetch_gmail_via_aparavi():
+
+@bp.route('/gmail/fetch', methods=['POST'])
+async def fetch_gmail_via_aparavi():
     """
     Dummy endpoint to fetch Gmail data through Aparavi pipeline
     
@@ -41,9 +212,10 @@ def fetch_gmail_via_aparavi():
     }
     """
     try:
-        request_data = request.get_json() or {}
+        request_data = await _read_json_body()
         email_filters = request_data.get('email_filters', {})
         max_results = request_data.get('max_results', 10)
+        sender = email_filters.get("from", "sender@example.com")
         
         # Simulate Aparavi SDK workflow
         response = {
@@ -61,79 +233,84 @@ def fetch_gmail_via_aparavi():
             "simulated_results": {
                 "emails_fetched": 3,
                 "emails": [
-                    {
-                        "id": "email_001",
-                        "from": email_filters.get("from", "sender@example.com"),
-                        "subject": f"Insurance Claim #{i+1001}",
-                        "date": "2024-10-01T10:30:00Z",
-                        "body_preview": f"This is a simulated email body for claim #{i+1001}",
-                        "attachments": [
-                            {
-                                "filename": f"claim_document_{i+1001}.pdf",
-                                "size": 245678,
-                                "mime_type": "application/pdf"
-                            }
-                        ],
-                        "parsed_data": {
-                            "claim_number": f"CLM-{i+1001}",
-                            "claim_type": "auto",
-                            "status": "pending"
-                        }
-                    } for i in range(min(max_results, 3))
+                    {**_EMAIL_TEMPLATES[i], "from": sender}
+                    for i in range(min(max_results, len(_EMAIL_TEMPLATES)))
                 ]
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
         
-        return jsonify(response), 200
+        return _negotiated_response(response)
         
     except Exception as e:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Failed to fetch Gmail via Aparavi: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat()
-        }), 500
+            "timestamp": _now_iso()
+        }, status=500)
 
 
-@app.route('/aparavi/pipeline/validate', methods=['POST'])
-def validate_pipeline():
+@bp.route('/pipeline/validate', methods=['POST'])
+async def validate_pipeline():
     """
     Dummy endpoint to validate Aparavi pipeline configuration
     """
     try:
-        # Load and return pipeline config
-        with open(PIPELINE_CONFIG_PATH, 'r') as f:
-            pipeline_config = json.load(f)
+        # Pipeline config is parsed once at import
+        if _PIPELINE_CONFIG_ERROR is not None:
+            raise _PIPELINE_CONFIG_ERROR
+        
+        if 'application/x-ndjson' in request.headers.get('Accept', ''):
+            return _stream_components()
         
         response = {
             "status": "success",
             "message": "Pipeline validation successful (DUMMY)",
             "pipeline": {
-                "id": pipeline_config.get("id"),
-                "components_count": len(pipeline_config.get("components", [])),
-                "components": [
-                    {
-                        "id": comp.get("id"),
-                        "provider": comp.get("provider"),
-                        "valid": True
-                    } for comp in pipeline_config.get("components", [])
-                ]
+                "id": _PIPELINE_CONFIG.get("id"),
+                "components_count": len(_PIPELINE_COMPONENTS_SUMMARY),
+                "components": _PIPELINE_COMPONENTS_SUMMARY
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
         
-        return jsonify(response), 200
+        return _negotiated_response(response)
         
     except Exception as e:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Pipeline validation failed: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat()
-        }), 500
+            "timestamp": _now_iso()
+        }, status=500)
+
+
+@bp.route('/pipeline/validate/stream', methods=['POST'])
+async def validate_pipeline_stream():
+    """
+    Dummy endpoint to validate Aparavi pipeline configuration,
+    streaming one component per line as JSON Lines
+    """
+    if _PIPELINE_CONFIG_ERROR is not None:
+        return _json_response({
+            "status": "error",
+            "message": f"Pipeline validation failed: {str(_PIPELINE_CONFIG_ERROR)}",
+            "timestamp": _now_iso()
+        }, status=500)
+    
+    return _stream_components()
+
+
+def _stream_components():
+    """Stream the component summary so the first line ships before the rest is encoded"""
+    async def _gen():
+        for comp in _PIPELINE_COMPONENTS_SUMMARY:
+            yield orjson.dumps(comp) + b"\n"
+
+    return Response(_gen(), status=200, mimetype='application/x-ndjson')
 
 
-@app.route('/aparavi/pipeline/execute', methods=['POST'])
-def execute_pipeline():
+@bp.route('/pipeline/execute', methods=['POST'])
+async def execute_pipeline():
     """
     Dummy endpoint to execute Aparavi pipeline workflow
     
@@ -144,7 +321,7 @@ def execute_pipeline():
     }
     """
     try:
-        request_data = request.get_json() or {}
+        request_data = await _read_json_body()
         
         # Simulate pipeline execution
         response = {
@@ -156,88 +333,79 @@ def execute_pipeline():
                 "pipeline_id": "52a62c64-c306-4584-8b60-d68b4df351b4",
                 "estimated_duration": "30s"
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
         
-        return jsonify(response), 200
+        return _json_response(response)
         
     except Exception as e:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Pipeline execution failed: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat()
-        }), 500
+            "timestamp": _now_iso()
+        }, status=500)
 
 
-@app.route('/aparavi/pipeline/status/<token>', methods=['GET'])
-def get_pipeline_status(token):
+@bp.route('/pipeline/status/<token>', methods=['GET'])
+async def get_pipeline_status(token):
     """
     Dummy endpoint to get pipeline execution status
     """
     try:
-        response = {
-            "status": "success",
-            "message": "Pipeline status retrieved (DUMMY)",
-            "data": {
-                "token": token,
-                "state": "completed",
-                "progress": 100,
-                "results": {
-                    "emails_processed": 3,
-                    "documents_parsed": 3,
-                    "errors": 0
-                }
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        return jsonify(response), 200
+        body = _STATUS_CACHE.get(token)
+        if body is None:
+            lock = _STATUS_LOCKS.get(token)
+            if lock is None:
+                lock = _STATUS_LOCKS[token] = asyncio.Lock()
+            async with lock:
+                # Another poller may have filled the cache while we waited
+                body = _STATUS_CACHE.get(token)
+                if body is None:
+                    body = b"".join((
+                        _STATUS_PREFIX, orjson.dumps(token),
+                        _STATUS_MIDDLE, _now_iso().encode(), _STATUS_SUFFIX
+                    ))
+                    _STATUS_CACHE[token] = body
+        return Response(body, status=200, mimetype='application/json')
         
     except Exception as e:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Failed to get status: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat()
-        }), 500
+            "timestamp": _now_iso()
+        }, status=500)
 
 
-@app.route('/aparavi/pipeline/teardown/<token>', methods=['DELETE'])
-def teardown_pipeline(token):
+@bp.route('/pipeline/teardown/<token>', methods=['DELETE'])
+async def teardown_pipeline(token):
     """
     Dummy endpoint to teardown/cleanup pipeline resources
     """
     try:
-        response = {
-            "status": "success",
-            "message": "Pipeline resources cleaned up (DUMMY)",
-            "data": {
-                "token": token,
-                "resources_freed": True
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        return jsonify(response), 200
+        body = b"".join((
+            _TEARDOWN_PREFIX, orjson.dumps(token),
+            _TEARDOWN_MIDDLE, _now_iso().encode(), _TEARDOWN_SUFFIX
+        ))
+        return Response(body, status=200, mimetype='application/json')
         
     except Exception as e:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Teardown failed: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat()
-        }), 500
+            "timestamp": _now_iso()
+        }, status=500)
 
 
-@app.route('/aparavi/health', methods=['GET'])
-def health_check():
+@bp.route('/health', methods=['GET'])
+async def health_check():
     """
     Health check endpoint
     """
-    return jsonify({
-        "status": "healthy",
-        "service": "Aparavi Gmail Fetcher (DUMMY)",
-        "version": "1.0.0-placeholder",
-        "timestamp": datetime.utcnow().isoformat()
-    }), 200
+    body = _HEALTH_PREFIX + _now_iso().encode() + _HEALTH_SUFFIX
+    return Response(body, status=200, mimetype='application/json')
+
+
+app.register_blueprint(bp, url_prefix='/aparavi')
 
 
 if __name__ == '__main__':
@@ -247,4 +415,20 @@ if __name__ == '__main__':
     print("This is NOT integrated with actual Aparavi services.")
     print("All responses are simulated for demonstration purposes.")
     print("=" * 60)
-    app.run(host='0.0.0.0', port=5001, debug=True)
+
+    if os.environ.get("APARAVI_DEV"):
+        # Single-process development server, opt-in only; the debugger
+        # and reloader are further opt-in via APARAVI_DEBUG=1
+        debug = os.environ.get("APARAVI_DEBUG") == "1"
+        app.run(host='0.0.0.0', port=5001, debug=debug, use_reloader=debug)
+    else:
+        from hypercorn.config import Config
+        from hypercorn.run import run
+
+        config = Config()
+        config.application_path = "aparavi_gmail_endpoint:app"
+        config.bind = [f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 5001)}"]
+        config.workers = int(os.getenv("WORKERS", os.cpu_count() or 1))
+        if importlib.util.find_spec("uvloop") is not None:
+            config.worker_class = "uvloop"
+        run(config)
@@ -28,6 +28,15 @@ echo "Response:"
 curl -X POST ${BASE_URL}/aparavi/pipeline/validate
 echo -e "\n\n"
 
+# 2b. Validate Pipeline (JSON Lines stream)
+echo "2b. Validate Pipeline Configuration (streamed as JSON Lines)"
+echo "Command:"
+echo "curl -X POST ${BASE_URL}/aparavi/pipeline/validate/stream"
+echo ""
+echo "Response:"
+curl -X POST ${BASE_URL}/aparavi/pipeline/validate/stream
+echo -e "\n\n"
+
 # 3. Fetch Gmail via Aparavi Pipeline
 echo "3. Fetch Gmail Data via Aparavi Pipeline"
 echo "Command:"
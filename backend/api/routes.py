@@ -3,25 +3,69 @@ FastAPI routes for claims triage system
 """
 
 import os
+import re
+import uuid
+import asyncio
 import logging
 import time
+import unicodedata
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Awaitable, AsyncIterator
 from datetime import datetime
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+import aiofiles
+import httpx
+import orjson
+from cachetools import TTLCache
+
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from services import get_mongodb_service, get_event_queue, get_rag_service, get_document_context_manager, get_gmail_service, get_pdf_generator, get_gmail_auto_fetch_service
+from services.claim_processor import process_claim_file
+from services.mongodb_service import MongoDBService
+from services.cache_hooks import register_invalidation_listener
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Simple in-memory cache with TTL
-_cache: Dict[str, Dict[str, Any]] = {}
+# Cache keys grouped by the data they depend on, so writes can invalidate precisely
+_cache_tags: Dict[str, set] = {"claims": set(), "adjusters": set(), "fraud": set()}
+
+
+class _TaggedTTLCache(TTLCache):
+    """TTLCache that also drops evicted and expired keys from _cache_tags, so the tag sets stay bounded"""
+
+    def popitem(self):
+        key, value = super().popitem()
+        for keys in _cache_tags.values():
+            keys.discard(key)
+        return key, value
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            for keys in _cache_tags.values():
+                keys.discard(key)
+        return expired
+
+
+# Bounded in-memory cache with TTL (expired and least-recently-used keys are evicted)
 CACHE_TTL = 5  # seconds
+CACHE_MAX_SIZE = 1024
+_cache: TTLCache = _TaggedTTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL)
+
+# Shared client for the local Pathway RAG server (keeps connections alive between queries)
+_pathway_client = httpx.AsyncClient(
+    base_url="http://127.0.0.1:8765",
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32)
+)
+
+# Loads currently in progress per cache key, shared by concurrent cache misses
+_inflight_loads: Dict[str, asyncio.Future] = {}
 
 # Data models
 class ClaimUploadResponse(BaseModel):
@@ -43,22 +87,118 @@ class AdjusterCreate(BaseModel):
 # Upload directory
 UPLOAD_DIR = Path(os.getenv("DATA_DIR", "./uploads"))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 1 << 20))  # bytes
+
+# Filename sanitization patterns
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\s.-]')
+_WHITESPACE = re.compile(r'\s+')
+
+# Background claim processing: hold task references so they aren't garbage collected
+# mid-run (the concurrency cap lives in process_claim_file)
+_inflight_tasks: set = set()
+
+# Max emails converted to PDFs at once in /api/gmail/fetch
+GMAIL_PROCESS_CONCURRENCY = 8
+
+# SSE keepalive: idle proxies typically drop streams after 60s+
+SSE_HEARTBEAT_INTERVAL = 15  # seconds
+SSE_RETRY_MS = 15000
 
 
 def get_cached(key: str) -> Optional[Any]:
     """Get cached value if not expired"""
-    if key in _cache:
-        entry = _cache[key]
-        if time.time() - entry["timestamp"] < CACHE_TTL:
-            return entry["data"]
-        else:
-            del _cache[key]
-    return None
+    return _cache.get(key)
+
+
+def set_cache(key: str, data: Any, tag: str):
+    """Set cached value and register its key under a tag"""
+    _cache[key] = data
+    _cache_tags[tag].add(key)
+
+
+async def cached_or_singleflight(key: str, tag: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for key, or load it once even if many requests miss together"""
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+
+    pending = _inflight_loads.get(key)
+    if pending is not None:
+        # Shield so a cancelled follower doesn't cancel the shared load
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    # Mark the outcome as retrieved even if no follower awaited it
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight_loads[key] = future
+    try:
+        data = await loader()
+        set_cache(key, data, tag)
+        future.set_result(data)
+        return data
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        _inflight_loads.pop(key, None)
+
+
+def invalidate(*tags: str):
+    """Drop every cached value registered under the given tags"""
+    for tag in tags:
+        keys = _cache_tags[tag]
+        for key in keys:
+            _cache.pop(key, None)
+        keys.clear()
+
+
+# Background writers (claim pipeline, auto-transition) invalidate through this hook
+register_invalidation_listener(invalidate)
 
 
-def set_cache(key: str, data: Any):
-    """Set cached value with timestamp"""
-    _cache[key] = {"data": data, "timestamp": time.time()}
+async def close_http_clients():
+    """Close shared outbound HTTP clients"""
+    await _pathway_client.aclose()
+
+
+# Formatted timestamp, recomputed at most once per second
+_iso_now_cache: Dict[str, Any] = {"second": -1, "value": ""}
+
+
+def _iso_now() -> str:
+    """Current local time in ISO format at 1-second resolution"""
+    second = int(time.time())
+    if second != _iso_now_cache["second"]:
+        _iso_now_cache["value"] = datetime.fromtimestamp(second).isoformat()
+        _iso_now_cache["second"] = second
+    return _iso_now_cache["value"]
+
+
+async def get_mongodb(request: Request) -> MongoDBService:
+    """MongoDB handle resolved once at startup and kept on app.state"""
+    mongodb = getattr(request.app.state, "mongodb", None)
+    if mongodb is None:
+        # Startup connection failed; connect on first use instead
+        mongodb = await get_mongodb_service()
+        request.app.state.mongodb = mongodb
+    return mongodb
+
+
+async def _cached_claims_count(mongodb: MongoDBService) -> int:
+    """Claim count shared by health/status polls, cached like the list endpoints"""
+    async def load():
+        return await mongodb.count_claims()
+
+    return await cached_or_singleflight("claims_count", "claims", load)
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in UPLOAD_CHUNK_SIZE pieces"""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
 
 
 @router.get("/")
@@ -72,51 +212,64 @@ async def root():
 
 
 @router.get("/api/health")
-async def health_check():
+async def health_check(request: Request):
     """System health check"""
     try:
-        mongodb = await get_mongodb_service()
-        claims_count = len(await mongodb.get_all_claims())
+        claims_count = await _cached_claims_count(await get_mongodb(request))
 
         return {
             "status": "healthy",
             "mongodb": "connected",
             "claims_processed": claims_count,
             "processing_mode": "direct_upload",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
     except Exception as e:
         return {
             "status": "degraded",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
 
 
 @router.get("/api/events/stream")
 async def stream_events(request: Request):
     """Server-Sent Events endpoint for real-time updates"""
-    import asyncio
-    import json
-
     async def event_generator():
         event_queue = get_event_queue()
+        queue = event_queue.subscribe()
         logger.info("SSE client connected")
 
         try:
+            # Ask clients to wait before reconnecting so drops don't cause reconnect storms
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+
             while True:
                 if await request.is_disconnected():
                     logger.info("SSE client disconnected")
                     break
 
-                event = await event_queue.subscribe()
-                event_data = json.dumps(event)
+                # Evict clients that cannot keep up instead of buffering for them
+                if event_queue.is_slow(queue):
+                    logger.warning("SSE client too slow, closing stream")
+                    yield "event: error\ndata: slow_consumer\n\n"
+                    break
+
+                try:
+                    event_data = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # Comment frame keeps proxies/load balancers from closing an idle stream
+                    yield ": ping\n\n"
+                    continue
+
                 yield f"data: {event_data}\n\n"
 
         except asyncio.CancelledError:
             logger.info("SSE connection cancelled")
         except Exception as e:
             logger.error(f"SSE error: {e}")
+        finally:
+            event_queue.unsubscribe(queue)
 
     return StreamingResponse(
         event_generator(),
@@ -133,30 +286,27 @@ async def stream_events(request: Request):
 async def upload_claim(file: UploadFile = File(...), background_tasks=None):
     """Upload claim document and process immediately"""
     try:
-        import unicodedata
-        import re
-        from services.claim_processor import process_claim_file
-
         # Sanitize filename
         normalized = unicodedata.normalize('NFKD', file.filename)
         ascii_filename = normalized.encode('ascii', 'ignore').decode('ascii')
-        clean_filename = re.sub(r'[^\w\s.-]', '', ascii_filename)
-        clean_filename = re.sub(r'\s+', '_', clean_filename)
+        clean_filename = _UNSAFE_FILENAME_CHARS.sub('', ascii_filename)
+        clean_filename = _WHITESPACE.sub('_', clean_filename)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_filename = f"{timestamp}_{clean_filename}"
         file_path = UPLOAD_DIR / safe_filename
 
-        # Save file
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        # Save file in fixed-size chunks; neither the read nor the write blocks the event loop
+        async with aiofiles.open(file_path, "wb") as f:
+            async for chunk in _iter_upload(file):
+                await f.write(chunk)
 
         logger.info(f"📤 Claim uploaded: {safe_filename}")
 
         # Process claim immediately (in background to not block response)
-        import asyncio
-        asyncio.create_task(process_claim_file(str(file_path)))
+        task = asyncio.create_task(process_claim_file(str(file_path)))
+        _inflight_tasks.add(task)
+        task.add_done_callback(_inflight_tasks.discard)
 
         # Generate temporary claim ID for response
         claim_id = Path(safe_filename).stem
@@ -173,33 +323,49 @@ async def upload_claim(file: UploadFile = File(...), background_tasks=None):
 
 
 @router.get("/api/claims/list")
-async def list_claims(status: Optional[str] = None):
+async def list_claims(status: Optional[str] = None, mongodb: MongoDBService = Depends(get_mongodb)):
     """List all claims"""
     try:
         cache_key = f"claims_list_{status}"
         cached = get_cached(cache_key)
         if cached is not None:
-            return cached
+            return Response(content=cached, media_type="application/json")
+
+        async def claims_json():
+            # Encode claims one at a time as the cursor yields them; "total" goes last
+            chunks = [b'{"claims":[']
+            yield chunks[0]
+            total = 0
+            complete = True
+            try:
+                async for claim in mongodb.stream_claims(status=status):
+                    chunk = orjson.dumps(claim, default=str)
+                    if total:
+                        chunk = b"," + chunk
+                    total += 1
+                    chunks.append(chunk)
+                    yield chunk
+            except Exception as e:
+                # The 200 is already sent: close the document so it stays valid JSON, but don't cache a partial list
+                logger.error(f"List claims stream failed: {e}")
+                complete = False
 
-        mongodb = await get_mongodb_service()
-        claims = await mongodb.get_all_claims(status=status)
+            tail = b'],"total":%d}' % total
+            chunks.append(tail)
+            yield tail
+            if complete:
+                set_cache(cache_key, b"".join(chunks), "claims")
 
-        result = {
-            "claims": claims,
-            "total": len(claims)
-        }
-        set_cache(cache_key, result)
-        return result
+        return StreamingResponse(claims_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"List claims failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/claims/queue")
-async def get_claims_queue():
+async def get_claims_queue(mongodb: MongoDBService = Depends(get_mongodb)):
     """Get claims in triage queue"""
     try:
-        mongodb = await get_mongodb_service()
         queue = await mongodb.get_claims_queue()
 
         return {
@@ -212,10 +378,9 @@ async def get_claims_queue():
 
 
 @router.get("/api/claims/{claim_id}")
-async def get_claim(claim_id: str):
+async def get_claim(claim_id: str, mongodb: MongoDBService = Depends(get_mongodb)):
     """Get claim details"""
     try:
-        mongodb = await get_mongodb_service()
         claim = await mongodb.get_claim(claim_id)
 
         if not claim:
@@ -229,42 +394,54 @@ async def get_claim(claim_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/api/claims/{claim_id}/text")
+async def get_claim_text(claim_id: str, mongodb: MongoDBService = Depends(get_mongodb)):
+    """Get the raw LandingAI extracted text for a claim"""
+    try:
+        text = await mongodb.get_claim_text(claim_id)
+
+        if text is None:
+            raise HTTPException(status_code=404, detail="Extracted text not found")
+
+        return PlainTextResponse(text)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get claim text failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/api/adjusters/list")
-async def list_adjusters(available_only: bool = False):
+async def list_adjusters(available_only: bool = False, mongodb: MongoDBService = Depends(get_mongodb)):
     """List all adjusters"""
     try:
-        cache_key = f"adjusters_list_{available_only}"
-        cached = get_cached(cache_key)
-        if cached is not None:
-            return cached
+        async def load():
+            adjusters = await mongodb.get_all_adjusters(available_only=available_only)
 
-        mongodb = await get_mongodb_service()
-        adjusters = await mongodb.get_all_adjusters(available_only=available_only)
+            return {
+                "adjusters": adjusters,
+                "total": len(adjusters)
+            }
 
-        result = {
-            "adjusters": adjusters,
-            "total": len(adjusters)
-        }
-        set_cache(cache_key, result)
-        return result
+        return await cached_or_singleflight(f"adjusters_list_{available_only}", "adjusters", load)
     except Exception as e:
         logger.error(f"List adjusters failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/api/adjusters/create")
-async def create_adjuster(adjuster: AdjusterCreate):
+async def create_adjuster(adjuster: AdjusterCreate, mongodb: MongoDBService = Depends(get_mongodb)):
     """Create new adjuster"""
     try:
-        mongodb = await get_mongodb_service()
 
-        adjuster_data = adjuster.dict()
+        adjuster_data = adjuster.model_dump()
         adjuster_data["available"] = True
         adjuster_data["current_workload"] = 0
 
         success = await mongodb.save_adjuster(adjuster_data)
 
         if success:
+            invalidate("adjusters")
             return {"message": "Adjuster created successfully", "adjuster_id": adjuster.adjuster_id}
         else:
             raise HTTPException(status_code=500, detail="Failed to create adjuster")
@@ -275,18 +452,16 @@ async def create_adjuster(adjuster: AdjusterCreate):
 
 
 @router.get("/api/adjusters/{adjuster_id}/workload")
-async def get_adjuster_workload(adjuster_id: str):
+async def get_adjuster_workload(adjuster_id: str, mongodb: MongoDBService = Depends(get_mongodb)):
     """Get adjuster's current workload"""
     try:
-        mongodb = await get_mongodb_service()
 
         adjuster = await mongodb.get_adjuster(adjuster_id)
         if not adjuster:
             raise HTTPException(status_code=404, detail="Adjuster not found")
 
         # Get active claims
-        all_claims = await mongodb.get_all_claims(status="assigned")
-        adjuster_claims = [c for c in all_claims if c.get("routing_decision", {}).get("adjuster_id") == adjuster_id]
+        adjuster_claims = await mongodb.get_claims_by_adjuster(adjuster_id, status="assigned")
 
         return {
             "adjuster_id": adjuster_id,
@@ -305,64 +480,60 @@ async def get_adjuster_workload(adjuster_id: str):
 
 
 @router.get("/api/analytics/fraud-flags")
-async def get_fraud_flags():
+async def get_fraud_flags(mongodb: MongoDBService = Depends(get_mongodb)):
     """Get all fraud flags"""
     try:
-        cache_key = "fraud_flags"
-        cached = get_cached(cache_key)
-        if cached is not None:
-            return cached
+        async def load():
+            claims_with_flags = await mongodb.get_fraud_flags()
 
-        mongodb = await get_mongodb_service()
-        claims_with_flags = await mongodb.get_fraud_flags()
+            return {
+                "fraud_flags": claims_with_flags,
+                "total": len(claims_with_flags)
+            }
 
-        result = {
-            "fraud_flags": claims_with_flags,
-            "total": len(claims_with_flags)
-        }
-        set_cache(cache_key, result)
-        return result
+        return await cached_or_singleflight("fraud_flags", "fraud", load)
     except Exception as e:
         logger.error(f"Get fraud flags failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/analytics/metrics")
-async def get_metrics():
+async def get_metrics(mongodb: MongoDBService = Depends(get_mongodb)):
     """Get processing metrics"""
     try:
-        cache_key = "metrics"
-        cached = get_cached(cache_key)
-        if cached is not None:
-            return cached
-
-        mongodb = await get_mongodb_service()
-        metrics = await mongodb.get_processing_metrics()
+        async def load():
+            return await mongodb.get_processing_metrics()
 
-        set_cache(cache_key, metrics)
-        return metrics
+        return await cached_or_singleflight("metrics", "claims", load)
     except Exception as e:
         logger.error(f"Get metrics failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/processing/status")
-async def get_processing_status():
+async def get_processing_status(request: Request):
     """Get claim processing system status"""
     try:
-        import os
-
         uploads_dir = str(UPLOAD_DIR)
         abs_uploads_dir = os.path.abspath(uploads_dir)
 
-        # Count files in uploads directory
-        files_in_dir = []
-        if os.path.exists(abs_uploads_dir):
-            files_in_dir = [f for f in os.listdir(abs_uploads_dir)
-                           if not f.startswith('.') and os.path.isfile(os.path.join(abs_uploads_dir, f))]
+        # Count files in uploads directory, keeping only the first 10 names
+        def _scan():
+            names, count = [], 0
+            if not os.path.exists(abs_uploads_dir):
+                return names, count
+            with os.scandir(abs_uploads_dir) as entries:
+                for e in entries:
+                    if e.name.startswith('.') or not e.is_file():
+                        continue
+                    count += 1
+                    if len(names) < 10:
+                        names.append(e.name)
+            return names, count
 
-        mongodb = await get_mongodb_service()
-        all_claims = await mongodb.get_all_claims()
+        file_list, files_count = await asyncio.to_thread(_scan)
+
+        claims_count = await _cached_claims_count(await get_mongodb(request))
 
         return {
             "processing_mode": "direct_upload",
@@ -370,28 +541,31 @@ async def get_processing_status():
             "uploads_dir": uploads_dir,
             "abs_uploads_dir": abs_uploads_dir,
             "dir_exists": os.path.exists(abs_uploads_dir),
-            "files_in_uploads": len(files_in_dir),
-            "claims_in_db": len(all_claims),
-            "file_list": files_in_dir[:10],  # Show first 10 files
-            "timestamp": datetime.now().isoformat()
+            "files_in_uploads": files_count,
+            "claims_in_db": claims_count,
+            "claims_in_flight": len(_inflight_tasks),
+            "file_list": file_list,  # Show first 10 files
+            "timestamp": _iso_now()
         }
     except Exception as e:
         logger.error(f"Get processing status failed: {e}", exc_info=True)
         return {
             "processing_mode": "direct_upload",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
 
 
 class ClaimStatusUpdate(BaseModel):
     status: str
 
+# Statuses that free up the assigned adjuster
+CLOSING_STATUSES = frozenset({"completed", "closed", "approved"})
+
 @router.patch("/api/claims/{claim_id}/status")
-async def update_claim_status(claim_id: str, update: ClaimStatusUpdate):
+async def update_claim_status(claim_id: str, update: ClaimStatusUpdate, mongodb: MongoDBService = Depends(get_mongodb)):
     """Update claim status with task tracking"""
     try:
-        mongodb = await get_mongodb_service()
         claim = await mongodb.get_claim(claim_id)
 
         if not claim:
@@ -400,29 +574,33 @@ async def update_claim_status(claim_id: str, update: ClaimStatusUpdate):
         old_status = claim.get("status")
         new_status = update.status
 
-        # Update status
-        success = await mongodb.update_claim_status(claim_id, new_status)
+        # Moving into review also creates a review check ID, written with the status in one update
+        review_check_id = None
+        if new_status == "review" and old_status == "in_progress":
+            review_check_id = f"CHECK-{str(uuid.uuid4())[:8].upper()}"
+            success = await mongodb.update_claim_fields(claim_id, {"status": new_status, "review_check_id": review_check_id})
+        else:
+            success = await mongodb.update_claim_status(claim_id, new_status)
 
         if success:
+            invalidate("claims", "fraud")
+
             # Decrement adjuster workload when claim is completed or closed
-            if new_status in ["completed", "closed", "approved"]:
+            if new_status in CLOSING_STATUSES:
                 routing_decision = claim.get("routing_decision", {})
                 adjuster_id = routing_decision.get("adjuster_id")
                 if adjuster_id and adjuster_id != "AUTO_SYSTEM":
                     await mongodb.update_adjuster_workload(adjuster_id, -1)
+                    invalidate("adjusters")
                     logger.info(f"Decremented workload for adjuster {adjuster_id} (claim {claim_id} completed)")
 
             # Handle status-specific actions
-            if new_status == "review" and old_status == "in_progress":
-                # Create review check ID
-                import uuid
-                review_check_id = f"CHECK-{str(uuid.uuid4())[:8].upper()}"
-                await mongodb.update_claim_field(claim_id, "review_check_id", review_check_id)
+            if review_check_id:
                 logger.info(f"🔍 Created review check {review_check_id} for claim {claim_id}")
 
                 # Publish event
                 event_queue = get_event_queue()
-                await event_queue.publish({
+                event_queue.publish({
                     "type": "claim_moved_to_review",
                     "message": f"Claim {claim_id} moved to review - Check ID: {review_check_id}",
                     "claim_id": claim_id,
@@ -432,7 +610,7 @@ async def update_claim_status(claim_id: str, update: ClaimStatusUpdate):
             elif new_status == "completed" and old_status in ["review", "pending_review"]:
                 # Publish completion event
                 event_queue = get_event_queue()
-                await event_queue.publish({
+                event_queue.publish({
                     "type": "claim_completed",
                     "message": f"✅ Claim {claim_id} completed and closed",
                     "claim_id": claim_id,
@@ -441,7 +619,7 @@ async def update_claim_status(claim_id: str, update: ClaimStatusUpdate):
             else:
                 # General status update event
                 event_queue = get_event_queue()
-                await event_queue.publish({
+                event_queue.publish({
                     "type": "claim_status_updated",
                     "message": f"Claim {claim_id} status updated to {new_status}",
                     "claim_id": claim_id,
@@ -460,10 +638,9 @@ async def update_claim_status(claim_id: str, update: ClaimStatusUpdate):
 
 
 @router.delete("/api/claims/{claim_id}")
-async def delete_claim(claim_id: str):
+async def delete_claim(claim_id: str, mongodb: MongoDBService = Depends(get_mongodb)):
     """Delete a claim"""
     try:
-        mongodb = await get_mongodb_service()
         claim = await mongodb.get_claim(claim_id)
 
         if not claim:
@@ -474,15 +651,18 @@ async def delete_claim(claim_id: str):
         adjuster_id = routing_decision.get("adjuster_id")
         if adjuster_id:
             await mongodb.update_adjuster_workload(adjuster_id, -1)
+            invalidate("adjusters")
             logger.info(f"Updated workload for adjuster {adjuster_id} (decreased by 1)")
 
         # Delete the claim
         success = await mongodb.delete_claim(claim_id)
 
         if success:
+            invalidate("claims", "fraud")
+
             # Publish deletion event
             event_queue = get_event_queue()
-            await event_queue.publish({
+            event_queue.publish({
                 "type": "claim_deleted",
                 "message": f"🗑️ Claim {claim_id} deleted",
                 "claim_id": claim_id
@@ -518,13 +698,10 @@ async def query_rag(chat_query: ChatQuery):
             rag_server = get_pathway_rag_server()
             if rag_server and rag_server.running:
                 try:
-                    import requests
-
                     # Query Pathway RAG server
-                    response = requests.post(
-                        "http://127.0.0.1:8765/v2/answer",
-                        json={"prompt": chat_query.query},
-                        timeout=30
+                    response = await _pathway_client.post(
+                        "/v2/answer",
+                        json={"prompt": chat_query.query}
                     )
 
                     if response.status_code == 200:
@@ -557,24 +734,23 @@ async def query_rag(chat_query: ChatQuery):
 
 
 @router.get("/api/chat/context/{claim_id}")
-async def get_claim_context(claim_id: str):
+async def get_claim_context(claim_id: str, mongodb: MongoDBService = Depends(get_mongodb)):
     """Get all context for a specific claim"""
     try:
-        # Get claim from MongoDB
-        mongodb = await get_mongodb_service()
-        claim = await mongodb.get_claim(claim_id)
+        rag_service = get_rag_service()
+        context_mgr = get_document_context_manager()
 
+        # Fetch the claim and RAG context concurrently; both only need the claim ID.
+        # gather retrieves both outcomes, so a failure in either never leaves an orphaned task
+        claim, rag_context = await asyncio.gather(
+            mongodb.get_claim(claim_id),
+            rag_service.get_claim_context(claim_id)
+        )
         if not claim:
             raise HTTPException(status_code=404, detail="Claim not found")
 
-        # Get document context
-        context_mgr = get_document_context_manager()
         doc_context = context_mgr.get_context(claim_id)
 
-        # Get RAG context
-        rag_service = get_rag_service()
-        rag_context = await rag_service.get_claim_context(claim_id)
-
         return {
             "claim": claim,
             "document_context": doc_context,
@@ -637,7 +813,7 @@ async def get_gmail_status():
         gmail_service = get_gmail_service()
 
         if gmail_service.is_connected():
-            user_email = gmail_service.get_user_email()
+            user_email = await gmail_service.run(gmail_service.get_user_email)
             return {
                 "connected": True,
                 "user_email": user_email,
@@ -666,7 +842,8 @@ async def fetch_gmail_claims(max_results: int = 10, days_back: int = 7):
             raise HTTPException(status_code=401, detail="Gmail not connected. Check credentials.json and token.json files.")
 
         # Fetch claim emails
-        emails = gmail_service.fetch_claim_emails(
+        emails = await gmail_service.run(
+            gmail_service.fetch_claim_emails,
             max_results=max_results,
             days_back=days_back
         )
@@ -678,42 +855,45 @@ async def fetch_gmail_claims(max_results: int = 10, days_back: int = 7):
                 "emails_processed": 0
             }
 
-        # Process emails into PDFs
+        # Process emails into PDFs concurrently, bounded to respect Gmail quotas
         pdf_generator = get_pdf_generator()
-        processed_count = 0
-        claim_ids = []
+        semaphore = asyncio.Semaphore(GMAIL_PROCESS_CONCURRENCY)
 
-        for email in emails:
-            try:
-                # Generate PDF from email
-                pdf_path = pdf_generator.generate_from_gmail_message(
-                    message_id=email['id'],
-                    subject=email['subject'],
-                    sender=email['from'],
-                    date=email['date'],
-                    body=email['body_html'] or email['body_text'] or email['snippet'],
-                    attachments=email['attachments'],
-                    output_dir=UPLOAD_DIR
-                )
-
-                if pdf_path:
-                    processed_count += 1
-                    claim_id = pdf_path.stem
-                    claim_ids.append(claim_id)
-
-                    # Mark email as read and add label
-                    gmail_service.mark_as_read(email['id'])
-                    gmail_service.add_label(email['id'], 'CLAIM_PROCESSED')
-
-                    logger.info(f"✅ Processed email to claim: {claim_id}")
+        async def _handle(email):
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        pdf_generator.generate_from_gmail_message,
+                        message_id=email['id'],
+                        subject=email['subject'],
+                        sender=email['from'],
+                        date=email['date'],
+                        body=email['body_html'] or email['body_text'] or email['snippet'],
+                        attachments=email['attachments'],
+                        output_dir=UPLOAD_DIR
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to process email {email['id']}: {e}")
+                    return None
 
-            except Exception as e:
-                logger.error(f"Failed to process email {email['id']}: {e}")
-                continue
+        pdf_paths = await asyncio.gather(*(_handle(email) for email in emails))
+
+        processed_ids = []
+        claim_ids = []
+        for email, pdf_path in zip(emails, pdf_paths):
+            if pdf_path:
+                processed_ids.append(email['id'])
+                claim_ids.append(pdf_path.stem)
+                logger.info(f"✅ Processed email to claim: {pdf_path.stem}")
+        processed_count = len(processed_ids)
+
+        # Mark all processed emails as read and labelled in one batch request
+        if processed_ids:
+            await gmail_service.run(gmail_service.mark_processed, processed_ids, 'CLAIM_PROCESSED')
 
         # Publish event
         event_queue = get_event_queue()
-        await event_queue.publish({
+        event_queue.publish({
             "type": "gmail_fetch_completed",
             "message": f"📧 Fetched {len(emails)} emails, processed {processed_count} claims",
             "emails_found": len(emails),
@@ -754,7 +934,8 @@ async def preview_gmail_claims(max_results: int = 10, days_back: int = 7):
             raise HTTPException(status_code=401, detail="Gmail not connected. Check credentials.json and token.json files.")
 
         # Fetch claim emails
-        emails = gmail_service.fetch_claim_emails(
+        emails = await gmail_service.run(
+            gmail_service.fetch_claim_emails,
             max_results=max_results,
             days_back=days_back
         )
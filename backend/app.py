@@ -4,17 +4,28 @@ Claims Triage System Backend
 """
 
 import os
+import stat
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from email.utils import parsedate
+from pathlib import Path
 
-from fastapi import FastAPI
+import aiofiles.os
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
 from dotenv import load_dotenv
 
-from api.routes import router
+from api.routes import router, close_http_clients
 from services import get_pathway_pipeline, get_mongodb_service, get_pinecone_service, get_gmail_auto_fetch_service
 from services.auto_transition import get_auto_transition_service
+from services.event_queue import get_event_queue
+from services.claim_processor import close_openai_client
 from services.pathway_rag_server import get_pathway_rag_server, PATHWAY_LLM_AVAILABLE
 
 # Load environment variables
@@ -27,6 +38,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds each service gets to initialize before startup moves on without it
+STARTUP_TIMEOUT = float(os.getenv("STARTUP_TIMEOUT", "15"))
+
+# Threads for blocking I/O (Gmail, PDF generation, file scans) run off the event loop
+IO_POOL_SIZE = int(os.getenv("IO_POOL", "64"))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,44 +53,30 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Claims Triage System API...")
 
-    # Initialize MongoDB
-    try:
-        mongodb = await get_mongodb_service()
-        logger.info("MongoDB connected")
-    except Exception as e:
-        logger.error(f"MongoDB connection failed: {e}")
-
-    # Initialize Pinecone
-    try:
-        pinecone = get_pinecone_service()
-        logger.info("Pinecone initialized")
-    except Exception as e:
-        logger.error(f"Pinecone initialization failed: {e}")
-
-    # Pathway pipeline disabled - processing claims directly on upload instead
-    # pathway_pipeline = get_pathway_pipeline()
-    # await pathway_pipeline.start_pipeline()
+    # Size the default executor for the blocking I/O shims (to_thread / run_in_executor)
+    io_executor = ThreadPoolExecutor(max_workers=IO_POOL_SIZE, thread_name_prefix="io")
+    asyncio.get_running_loop().set_default_executor(io_executor)
 
-    logger.info("Pathway pipeline disabled (processing on upload)")
+    # Bind the event queue to this loop before any background thread (Pathway) can publish
+    get_event_queue().start()
 
     # Start Pathway RAG server (for real-time vector-based Q&A)
     if PATHWAY_LLM_AVAILABLE:
         try:
-            rag_server = get_pathway_rag_server(
-                data_dir=os.getenv("DATA_DIR", "./uploads"),
-                host="127.0.0.1",
-                port=8765
+            rag_server = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    get_pathway_rag_server,
+                    data_dir=os.getenv("DATA_DIR", "./uploads"),
+                    host="127.0.0.1",
+                    port=8765
+                )
             )
 
             if rag_server:
-                # Run RAG server in background thread
-                import threading
-                rag_thread = threading.Thread(
-                    target=rag_server.run,
-                    daemon=True,
-                    name="PathwayRAGServer"
-                )
-                rag_thread.start()
+                # Run RAG server in a background thread with its own event loop
+                rag_server.run_in_thread()
+                app.state.rag_server = rag_server
                 logger.info("✅ Pathway RAG server started on http://127.0.0.1:8765")
                 logger.info("   📬 POST /v2/answer - Ask questions about claims")
                 logger.info("   📊 GET  /v1/statistics - Get RAG indexer stats")
@@ -84,17 +87,57 @@ async def lifespan(app: FastAPI):
         logger.warning("Pathway LLM xpack not available - install with: pip install 'pathway[xpack-llm]'")
         logger.warning("RAG will use fallback mode (basic text search)")
 
-    # Start auto-transition service
-    auto_transition = get_auto_transition_service()
-    await auto_transition.start()
+    # Independent services start concurrently so startup takes as long as the slowest one
+    async def init_mongo():
+        mongodb = await get_mongodb_service()
+        app.state.mongodb = mongodb
+
+    async def init_pinecone():
+        # Client construction does a blocking network handshake
+        await asyncio.get_running_loop().run_in_executor(None, get_pinecone_service)
+
+    async def init_auto_transition():
+        auto_transition = get_auto_transition_service()
+        app.state.auto_transition = auto_transition
+        await auto_transition.start()
 
-    logger.info("Auto-transition service initialized")
+    async def init_gmail():
+        gmail_auto_fetch = get_gmail_auto_fetch_service()
+        app.state.gmail = gmail_auto_fetch
+        await gmail_auto_fetch.start()
+
+    async def init_pathway_pipeline():
+        await get_pathway_pipeline().start_pipeline()
+
+    services = {
+        "MongoDB": init_mongo(),
+        "Pinecone": init_pinecone(),
+        "Auto-transition service": init_auto_transition(),
+        "Gmail auto-fetch service": init_gmail(),
+    }
+
+    # Pathway pipeline is off by default - claims are processed directly on upload instead
+    if os.getenv("ENABLE_PATHWAY_PIPELINE", "0") == "1":
+        services["Pathway pipeline"] = init_pathway_pipeline()
+    else:
+        logger.info("Pathway pipeline disabled (processing on upload)")
+    # Bound each init so a hung handshake (e.g. DNS failure) can't stall startup
+    results = await asyncio.gather(
+        *(asyncio.wait_for(init, STARTUP_TIMEOUT) for init in services.values()),
+        return_exceptions=True
+    )
 
-    # Start Gmail auto-fetch service
-    gmail_auto_fetch = get_gmail_auto_fetch_service()
-    await gmail_auto_fetch.start()
+    for name, result in zip(services, results):
+        if isinstance(result, asyncio.TimeoutError):
+            logger.error(f"{name} initialization timed out after {STARTUP_TIMEOUT}s")
+        elif isinstance(result, Exception):
+            logger.error(f"{name} initialization failed: {result}")
+        else:
+            logger.info(f"{name} initialized")
 
-    logger.info("Gmail auto-fetch service initialized")
+    # Build the OpenAPI schema now rather than on the first /docs request; app.openapi() memoizes it
+    if app.openapi_url:
+        app.openapi()
 
     yield
 
@@ -103,31 +146,57 @@ async def lifespan(app: FastAPI):
 
     # Stop Gmail auto-fetch service
     try:
-        gmail_auto_fetch = get_gmail_auto_fetch_service()
-        await gmail_auto_fetch.stop()
+        await app.state.gmail.stop()
     except:
         pass
 
     # Stop auto-transition service
     try:
-        auto_transition = get_auto_transition_service()
-        await auto_transition.stop()
+        await app.state.auto_transition.stop()
+    except:
+        pass
+
+    # Pathway RAG server can't be stopped (pw.run has no stop hook); its daemon thread ends with the
+    # process, so only stop routing questions to it
+    try:
+        app.state.rag_server.mark_unavailable()
+    except:
+        pass
+
+    # Stop event dispatcher
+    try:
+        await get_event_queue().stop()
+    except:
+        pass
+
+    # Close shared HTTP clients
+    try:
+        await close_http_clients()
+    except:
+        pass
+
+    try:
+        await close_openai_client()
     except:
         pass
 
     # Close MongoDB connection
     try:
-        mongodb = await get_mongodb_service()
-        await mongodb.close()
+        await app.state.mongodb.close()
     except:
         pass
 
+    io_executor.shutdown(wait=False, cancel_futures=True)
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Claims Triage System API",
     description="Automated claims processing with intelligent routing",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    # No schema or docs endpoints in production
+    openapi_url=None if os.getenv("ENV") == "prod" else "/openapi.json",
     lifespan=lifespan
 )
 
@@ -143,8 +212,43 @@ app.add_middleware(
 # Include routes
 app.include_router(router)
 
-# Mount uploads directory for serving files
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# Serve uploaded files (resolved once; requests may not escape this directory)
+UPLOADS_ROOT = Path("uploads").resolve()
+
+
+def _is_not_modified(response_headers: Headers, request_headers: Headers) -> bool:
+    """Conditional GET check, same rules as StaticFiles: If-None-Match takes precedence over If-Modified-Since"""
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = response_headers["etag"]
+        return etag in [tag.strip(" W/") for tag in if_none_match.split(",")]
+
+    if_modified_since = parsedate(request_headers.get("if-modified-since", ""))
+    last_modified = parsedate(response_headers.get("last-modified", ""))
+    return if_modified_since is not None and last_modified is not None and if_modified_since >= last_modified
+
+
+@app.api_route("/uploads/{path:path}", methods=["GET", "HEAD"], name="uploads")
+async def serve_upload(path: str, request: Request):
+    """Serve a file from the uploads directory without blocking the event loop on stat"""
+    # realpath touches the filesystem for symlinks, so keep it off the loop too
+    file_path = Path(await asyncio.to_thread(os.path.realpath, UPLOADS_ROOT / path))
+    if not file_path.is_relative_to(UPLOADS_ROOT):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    try:
+        stat_result = await aiofiles.os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    # FileResponse streams via sendfile where the server supports it, and sends headers only for HEAD
+    response = FileResponse(file_path, stat_result=stat_result)
+    if _is_not_modified(response.headers, request.headers):
+        return NotModifiedResponse(response.headers)
+    return response
 
 
 if __name__ == "__main__":
@@ -153,12 +257,28 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8080))
 
-    logger.info(f"Starting server on {host}:{port}")
-
-    uvicorn.run(
-        "app:app",
-        host=host,
-        port=port,
-        reload=True,
-        log_level="info"
-    )
+    if os.getenv("ENV") == "prod":
+        # Lifespan runs once per worker: background services (auto-transition, Gmail auto-fetch,
+        # Pathway RAG on a fixed port) and the in-memory SSE queue and caches are per process,
+        # so more than one worker duplicates fetches and splits events. Keep 1 unless those move out.
+        workers = int(os.getenv("WORKERS", "1"))
+        logger.info(f"Starting server on {host}:{port} with {workers} workers")
+
+        uvicorn.run(
+            "app:app",
+            host=host,
+            port=port,
+            workers=workers,
+            reload=False,
+            log_level="info"
+        )
+    else:
+        logger.info(f"Starting server on {host}:{port}")
+
+        uvicorn.run(
+            "app:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level="info"
+        )
@@ -4,7 +4,7 @@ Pydantic models for adjusters
 
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -53,6 +53,8 @@ class AdjusterProfile(BaseModel):
 
 
 class AdjusterWorkload(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     adjuster_id: str
     adjuster_name: str
     current_claims: int
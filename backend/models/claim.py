@@ -4,7 +4,7 @@ Pydantic models for claims
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -42,7 +42,17 @@ class ClaimStatus(str, Enum):
     REJECTED = "rejected"
 
 
+class FraudFlagType(str, Enum):
+    LATE_REPORTING = "late_reporting"
+    INCONSISTENT_STORY = "inconsistent_story"
+    SUSPICIOUS_PATTERN = "suspicious_pattern"
+    SOFT_TISSUE_ONLY = "soft_tissue_only"
+    EXCESSIVE_INJURIES = "excessive_injuries"
+
+
 class Party(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     role: str  # claimant, insured, third_party, witness
     contact: Optional[str] = None
@@ -50,6 +60,8 @@ class Party(BaseModel):
 
 
 class Location(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     address: Optional[str] = None
     city: Optional[str] = None
     state: Optional[str] = None
@@ -59,6 +71,8 @@ class Location(BaseModel):
 
 
 class Injury(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     person: str
     severity: str  # minor, moderate, serious, critical, fatal
     description: str
@@ -81,13 +95,17 @@ class ExtractedData(BaseModel):
 
 
 class FraudFlag(BaseModel):
-    type: str
+    model_config = ConfigDict(frozen=True)
+
+    type: FraudFlagType
     confidence: float  # 0-1
     evidence: str
     severity: str  # low, medium, high
 
 
 class RoutingDecision(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     assigned_to: Optional[str] = None
     adjuster_id: Optional[str] = None
     priority: Priority
@@ -103,7 +121,9 @@ class ClaimDocument(BaseModel):
     uploaded_at: datetime = Field(default_factory=datetime.now)
 
     extracted_data: Optional[ExtractedData] = None
-    extracted_text: Optional[str] = None  # Raw text extracted by LandingAI
+    extracted_text_ref: Optional[str] = None  # Key into claim_texts for the raw LandingAI text
+    extracted_text_preview: Optional[str] = None
+    extracted_text_length: Optional[int] = None
 
     severity_score: Optional[float] = None  # 0-100
     complexity_score: Optional[float] = None  # 0-100
@@ -19,7 +19,8 @@ from services.mongodb_service import get_mongodb_service
 
 async def seed_adjusters():
     """Seed demo adjusters"""
-    print("Seeding demo adjusters...")
+    # Collect output and write it once at the end instead of printing line by line
+    log = ["Seeding demo adjusters..."]
 
     mongodb = await get_mongodb_service()
 
@@ -82,17 +83,20 @@ async def seed_adjusters():
         },
     ]
 
+    success = await mongodb.save_adjusters_bulk(adjusters)
     for adjuster in adjusters:
-        success = await mongodb.save_adjuster(adjuster)
         if success:
-            print(f"✅ Created adjuster: {adjuster['name']} ({adjuster['adjuster_id']})")
+            log.append(f"✅ Created adjuster: {adjuster['name']} ({adjuster['adjuster_id']})")
         else:
-            print(f"❌ Failed to create adjuster: {adjuster['name']}")
+            log.append(f"❌ Failed to create adjuster: {adjuster['name']}")
 
-    print(f"\nSeeded {len(adjusters)} adjusters successfully!")
-    print("\nAdjusters:")
+    log.append(f"\nSeeded {len(adjusters)} adjusters successfully!")
+    log.append("\nAdjusters:")
     for adj in adjusters:
-        print(f"  - {adj['name']}: {', '.join(adj['specializations'])} ({adj['experience_level']})")
+        log.append(f"  - {adj['name']}: {', '.join(adj['specializations'])} ({adj['experience_level']})")
+
+    sys.stdout.write('\n'.join(log) + '\n')
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -2,20 +2,46 @@
 Services initialization
 """
 
-from .mongodb_service import get_mongodb_service
-from .pinecone_service import get_pinecone_service
-from .document_processor import get_document_processor
-from .claim_scorer import ClaimScorer, get_claim_scorer
-from .fraud_detector import FraudDetector, get_fraud_detector
-from .router_engine import RouterEngine, get_router_engine
-from .pathway_pipeline import PathwayPipeline, get_pathway_pipeline
-from .event_queue import EventQueue, get_event_queue
-from .auto_processor import AutoProcessor, get_auto_processor
-from .rag_service import RAGService, get_rag_service
-from .document_context import DocumentContextManager, get_document_context_manager
-from .gmail_service import GmailService, get_gmail_service
-from .pdf_generator import PDFGenerator, get_pdf_generator
-from .gmail_auto_fetch import GmailAutoFetchService, get_gmail_auto_fetch_service
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so a script that only
+# needs MongoDB doesn't pull in Pinecone, Pathway, Gmail, PDF and LLM dependencies
+_LAZY = {
+    "get_mongodb_service": "mongodb_service",
+    "get_pinecone_service": "pinecone_service",
+    "get_document_processor": "document_processor",
+    "ClaimScorer": "claim_scorer",
+    "get_claim_scorer": "claim_scorer",
+    "FraudDetector": "fraud_detector",
+    "get_fraud_detector": "fraud_detector",
+    "RouterEngine": "router_engine",
+    "get_router_engine": "router_engine",
+    "PathwayPipeline": "pathway_pipeline",
+    "get_pathway_pipeline": "pathway_pipeline",
+    "EventQueue": "event_queue",
+    "get_event_queue": "event_queue",
+    "AutoProcessor": "auto_processor",
+    "get_auto_processor": "auto_processor",
+    "RAGService": "rag_service",
+    "get_rag_service": "rag_service",
+    "DocumentContextManager": "document_context",
+    "get_document_context_manager": "document_context",
+    "GmailService": "gmail_service",
+    "get_gmail_service": "gmail_service",
+    "PDFGenerator": "pdf_generator",
+    "get_pdf_generator": "pdf_generator",
+    "GmailAutoFetchService": "gmail_auto_fetch",
+    "get_gmail_auto_fetch_service": "gmail_auto_fetch",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
 
 __all__ = [
     "get_mongodb_service",
@@ -3,11 +3,62 @@ Auto-Processing Service
 Handles automatic processing and routing of minor claims
 """
 
+import math
+import functools
 import logging
 from typing import Dict, Any, Optional
 
+from services.claim_scorer import keyword_pattern
+
 logger = logging.getLogger(__name__)
 
+JUNIOR_LEVELS = frozenset({"junior", "entry"})
+
+# auto_decision templates; only estimated_payout varies per claim
+_GLASS_DECISION = {"status": "auto_approved", "priority": "low", "action": "approve", "processing_type": "glass_replacement"}
+_MINOR_DECISION = {"status": "auto_approved", "priority": "low", "action": "approve", "processing_type": "minor_repair"}
+_SIMPLE_DECISION = {"status": "auto_approved", "priority": "low", "action": "approve", "processing_type": "simple_claim"}
+_JUNIOR_DECISION = {"status": "auto_routed", "priority": "low", "action": "route_to_junior", "processing_type": "junior_review"}
+
+# Checklists are immutable and shared by every routing decision that uses them
+_CHECKLISTS = {
+    "glass_replacement": (
+        "Verify glass damage photos",
+        "Confirm no additional damage",
+        "Approve glass shop estimate",
+        "Schedule repair appointment"
+    ),
+    "minor_repair": (
+        "Review damage photos",
+        "Verify repair estimate",
+        "Approve payment under $500",
+        "Confirm no hidden damage"
+    ),
+}
+_DEFAULT_CHECKLIST = (
+    "Quick review of documentation",
+    "Verify claim amount",
+    "Approve payment"
+)
+_JUNIOR_CHECKLIST = (
+    "Review claim documentation",
+    "Verify damage and estimate",
+    "Contact insured if needed",
+    "Approve or escalate to senior adjuster"
+)
+
+# Outcomes with no per-claim fields are shared rather than rebuilt (callers only read them)
+_TOO_COMPLEX_RESULT = {
+    "should_auto_process": False,
+    "reason": "Requires adjuster review due to complexity",
+    "auto_decision": None
+}
+_FULL_REVIEW_RESULT = {
+    "should_auto_process": False,
+    "reason": "Requires full adjuster review",
+    "auto_decision": None
+}
+
 
 class AutoProcessor:
     """Automatically process and approve minor claims"""
@@ -21,6 +72,10 @@ class AutoProcessor:
             "cosmetic", "chip", "ding"
         ]
 
+        # Matched at a word start like the claim scorer, so "windshields" counts but "accident" isn't a "dent"
+        self._glass_re = keyword_pattern(*self.glass_damage_types)
+        self._minor_re = keyword_pattern(*self.minor_damage_keywords)
+
     def should_auto_process(self, claim_data: Dict[str, Any], severity_score: float, complexity_score: float) -> Dict[str, Any]:
         """
         Determine if claim should be auto-processed
@@ -33,105 +88,94 @@ class AutoProcessor:
             if claim_amount is None:
                 claim_amount = 0
 
-            incident_type = claim_data.get("incident_type", "").lower()
             description = claim_data.get("description", "").lower()
-            injuries = claim_data.get("injuries", [])
-            if injuries is None:
-                injuries = []
-
-            # Rule 1: No injuries, low amount, AND low complexity
-            if not injuries and claim_amount > 0 and claim_amount <= self.auto_approve_threshold:
-                # IMPORTANT: Only auto-approve if BOTH severity and complexity are low
-                # This ensures complex claims go to real adjusters
-                is_simple_enough = severity_score <= 15 and complexity_score <= 30
-
-                if not is_simple_enough:
-                    # Too complex for auto-approval, needs human adjuster
-                    logger.info(f"Claim too complex for auto-approval: severity={severity_score}, complexity={complexity_score}")
-                    return {
-                        "should_auto_process": False,
-                        "reason": "Requires adjuster review due to complexity",
-                        "auto_decision": None
-                    }
-
-                # Check if it's glass damage
-                is_glass_damage = any(keyword in description for keyword in self.glass_damage_types)
-
-                if is_glass_damage:
-                    return {
-                        "should_auto_process": True,
-                        "reason": "Auto-approved: Simple glass damage under $500 with no injuries",
-                        "auto_decision": {
-                            "status": "auto_approved",
-                            "priority": "low",
-                            "action": "approve",
-                            "estimated_payout": claim_amount,
-                            "processing_type": "glass_replacement"
-                        }
-                    }
-
-                # Check if it's other minor damage
-                is_minor_damage = any(keyword in description for keyword in self.minor_damage_keywords)
-
-                if is_minor_damage:
-                    return {
-                        "should_auto_process": True,
-                        "reason": f"Auto-approved: Simple minor damage (${claim_amount}) with no injuries",
-                        "auto_decision": {
-                            "status": "auto_approved",
-                            "priority": "low",
-                            "action": "approve",
-                            "estimated_payout": claim_amount,
-                            "processing_type": "minor_repair"
-                        }
-                    }
-
-            # Rule 2: Very low severity and complexity scores
-            if severity_score <= 15 and complexity_score <= 25 and not injuries:
+            has_injuries = bool(claim_data.get("injuries"))
+
+            processing_type = self._decide(claim_amount, has_injuries, severity_score, complexity_score, description)
+
+            if processing_type == "too_complex":
+                # Too complex for auto-approval, needs human adjuster
+                logger.info("Claim too complex for auto-approval: severity=%s, complexity=%s", severity_score, complexity_score)
+                return _TOO_COMPLEX_RESULT
+
+            if processing_type == "glass_replacement":
+                return {
+                    "should_auto_process": True,
+                    "reason": "Auto-approved: Simple glass damage under $500 with no injuries",
+                    "auto_decision": {**_GLASS_DECISION, "estimated_payout": claim_amount}
+                }
+
+            if processing_type == "minor_repair":
+                return {
+                    "should_auto_process": True,
+                    "reason": f"Auto-approved: Simple minor damage (${claim_amount}) with no injuries",
+                    "auto_decision": {**_MINOR_DECISION, "estimated_payout": claim_amount}
+                }
+
+            if processing_type == "simple_claim":
                 return {
                     "should_auto_process": True,
                     "reason": "Auto-approved: Very low severity and complexity with no injuries",
-                    "auto_decision": {
-                        "status": "auto_approved",
-                        "priority": "low",
-                        "action": "approve",
-                        "estimated_payout": claim_amount if claim_amount > 0 else 500,
-                        "processing_type": "simple_claim"
-                    }
+                    "auto_decision": {**_SIMPLE_DECISION, "estimated_payout": claim_amount if claim_amount > 0 else 500}
                 }
 
-            # Rule 3: Route to junior adjuster for simple claims under $2000
-            if not injuries and claim_amount > self.auto_approve_threshold and claim_amount <= 2000:
-                is_simple = severity_score <= 25 and complexity_score <= 30
-
-                if is_simple:
-                    return {
-                        "should_auto_process": True,
-                        "reason": "Auto-routed to junior adjuster: Simple claim under $2000",
-                        "auto_decision": {
-                            "status": "auto_routed",
-                            "priority": "low",
-                            "action": "route_to_junior",
-                            "estimated_payout": claim_amount,
-                            "processing_type": "junior_review"
-                        }
-                    }
+            if processing_type == "junior_review":
+                return {
+                    "should_auto_process": True,
+                    "reason": "Auto-routed to junior adjuster: Simple claim under $2000",
+                    "auto_decision": {**_JUNIOR_DECISION, "estimated_payout": claim_amount}
+                }
 
             # No auto-processing rules apply
-            return {
-                "should_auto_process": False,
-                "reason": "Requires full adjuster review",
-                "auto_decision": None
-            }
+            return _FULL_REVIEW_RESULT
 
         except Exception as e:
-            logger.error(f"Auto-processing check failed: {e}")
+            logger.error("Auto-processing check failed: %s", e)
             return {
                 "should_auto_process": False,
                 "reason": f"Error in auto-processing: {str(e)}",
                 "auto_decision": None
             }
 
+    def _decide(
+        self,
+        claim_amount: float,
+        has_injuries: bool,
+        severity_score: float,
+        complexity_score: float,
+        description: str
+    ) -> Optional[str]:
+        """
+        Apply the auto-processing rules once over the extracted scalars
+
+        Returns:
+            processing_type of the first matching rule, "too_complex", or None
+        """
+        # Every rule requires no injuries
+        if has_injuries:
+            return None
+
+        # Rule 1: Low amount, AND low complexity
+        if 0 < claim_amount <= self.auto_approve_threshold:
+            # IMPORTANT: Only auto-approve if BOTH severity and complexity are low
+            # This ensures complex claims go to real adjusters
+            if severity_score > 15 or complexity_score > 30:
+                return "too_complex"
+            if self._glass_re.search(description):
+                return "glass_replacement"
+            if self._minor_re.search(description):
+                return "minor_repair"
+
+        # Rule 2: Very low severity and complexity scores
+        if severity_score <= 15 and complexity_score <= 25:
+            return "simple_claim"
+
+        # Rule 3: Route to junior adjuster for simple claims under $2000
+        if self.auto_approve_threshold < claim_amount <= 2000 and severity_score <= 25 and complexity_score <= 30:
+            return "junior_review"
+
+        return None
+
     async def process_auto_approved_claim(
         self,
         claim_id: str,
@@ -148,27 +192,8 @@ class AutoProcessor:
             processing_type = auto_decision.get("processing_type", "auto_approved")
             estimated_payout = auto_decision.get("estimated_payout", 0)
 
-            # Generate checklist based on processing type
-            if processing_type == "glass_replacement":
-                checklist = [
-                    "Verify glass damage photos",
-                    "Confirm no additional damage",
-                    "Approve glass shop estimate",
-                    "Schedule repair appointment"
-                ]
-            elif processing_type == "minor_repair":
-                checklist = [
-                    "Review damage photos",
-                    "Verify repair estimate",
-                    "Approve payment under $500",
-                    "Confirm no hidden damage"
-                ]
-            else:
-                checklist = [
-                    "Quick review of documentation",
-                    "Verify claim amount",
-                    "Approve payment"
-                ]
+            # Checklist based on processing type
+            checklist = _CHECKLISTS.get(processing_type, _DEFAULT_CHECKLIST)
 
             return {
                 "assigned_to": "Auto-Processor System",
@@ -182,7 +207,7 @@ class AutoProcessor:
             }
 
         except Exception as e:
-            logger.error(f"Auto-processing failed: {e}")
+            logger.error("Auto-processing failed: %s", e)
             return {
                 "assigned_to": None,
                 "adjuster_id": None,
@@ -206,48 +231,42 @@ class AutoProcessor:
             Selected junior adjuster or None
         """
         try:
-            # Find available junior adjusters
-            junior_adjusters = [
-                adj for adj in available_adjusters
-                if adj.get("experience_level", "").lower() in ["junior", "entry"]
-                and adj.get("available", False)
-                and adj.get("current_workload", 0) < adj.get("max_concurrent_claims", 15)
-            ]
-
-            if not junior_adjusters:
+            # Single pass: available junior adjuster with the lowest workload
+            best_adjuster = None
+            best_workload = math.inf
+            for adj in available_adjusters:
+                if adj.get("experience_level", "").lower() not in JUNIOR_LEVELS:
+                    continue
+                if not adj.get("available", False):
+                    continue
+                workload = adj.get("current_workload", 0)
+                if workload >= adj.get("max_concurrent_claims", 15):
+                    continue
+                if workload < best_workload:
+                    best_workload = workload
+                    best_adjuster = adj
+
+            if best_adjuster is None:
                 logger.warning("No junior adjusters available for auto-routing")
                 return None
 
-            # Select adjuster with lowest workload
-            best_adjuster = min(junior_adjusters, key=lambda x: x.get("current_workload", 0))
-
             return {
                 "assigned_to": best_adjuster.get("name"),
                 "adjuster_id": best_adjuster.get("adjuster_id"),
                 "priority": "low",
                 "reason": "Auto-routed to junior adjuster for simple claim review",
                 "estimated_workload_hours": 2.0,
-                "investigation_checklist": [
-                    "Review claim documentation",
-                    "Verify damage and estimate",
-                    "Contact insured if needed",
-                    "Approve or escalate to senior adjuster"
-                ],
+                "investigation_checklist": _JUNIOR_CHECKLIST,
                 "auto_routed": True
             }
 
         except Exception as e:
-            logger.error(f"Junior adjuster routing failed: {e}")
+            logger.error("Junior adjuster routing failed: %s", e)
             return None
 
 
-# Singleton instance
-_auto_processor_instance = None
-
-
+# Singleton instance: cached on first call
+@functools.lru_cache(maxsize=1)
 def get_auto_processor() -> AutoProcessor:
     """Get or create auto processor instance"""
-    global _auto_processor_instance
-    if _auto_processor_instance is None:
-        _auto_processor_instance = AutoProcessor()
-    return _auto_processor_instance
+    return AutoProcessor()
@@ -4,21 +4,43 @@ Automatically transitions claims through statuses: in_progress -> review -> comp
 """
 
 import asyncio
+import heapq
+import functools
 import logging
 import time
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from .cache_hooks import notify_data_changed
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class TransitionInfo:
+    """Auto-transition state for one queued claim"""
+    claim_id: str
+    claim_amount: float
+    current_status: str
+    scheduled_at: float
+    next_transition_at: float
+
+
 class AutoTransitionService:
     """Service to automatically transition claims through workflow stages"""
 
     def __init__(self):
         self.running = False
-        self.transition_queue: Dict[str, Dict[str, Any]] = {}
+        # Payload per claim; the heap orders (next_transition_at, claim_id) so the loop only touches due claims
+        self.state: Dict[str, TransitionInfo] = {}
+        self.heap: List[Tuple[float, str]] = []
         self.task = None
+        self._wake = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Bound once in start() so transitions skip the import and service lookup
+        self._mongodb = None
+        self._events = None
 
     async def start(self):
         """Start the auto-transition service"""
@@ -26,7 +48,14 @@ class AutoTransitionService:
             logger.warning("Auto-transition service already running")
             return
 
+        from .mongodb_service import get_mongodb_service
+        from .event_queue import get_event_queue
+
+        self._mongodb = await get_mongodb_service()
+        self._events = get_event_queue()
+
         self.running = True
+        self._loop = asyncio.get_running_loop()
         self.task = asyncio.create_task(self._process_transitions())
         logger.info("✅ Auto-transition service started")
 
@@ -49,88 +78,158 @@ class AutoTransitionService:
             claim_id: The claim identifier
             claim_amount: The claim amount for check ID generation
         """
-        self.transition_queue[claim_id] = {
-            "claim_id": claim_id,
-            "claim_amount": claim_amount,
-            "current_status": "in_progress",
-            "scheduled_at": time.time(),
-            "next_transition_at": time.time() + 10  # 10 seconds from now
-        }
-        logger.info(f"📅 Scheduled auto-transition for claim {claim_id}")
+        # Callers on another thread (e.g. the Pathway pipeline) hand off to the service loop
+        if self._loop is not None and self._loop.is_running() and self._running_loop() is not self._loop:
+            self._loop.call_soon_threadsafe(self.schedule_transition, claim_id, claim_amount)
+            return
+
+        now = time.time()
+        next_transition_at = now + 10  # 10 seconds from now
+        self.state[claim_id] = TransitionInfo(
+            claim_id=claim_id,
+            claim_amount=claim_amount,
+            current_status="in_progress",
+            scheduled_at=now,
+            next_transition_at=next_transition_at
+        )
+        heapq.heappush(self.heap, (next_transition_at, claim_id))
+        self._wake.set()
+        logger.info("📅 Scheduled auto-transition for claim %s", claim_id)
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
 
     async def _process_transitions(self):
         """Main loop to process claim transitions"""
-        from .mongodb_service import get_mongodb_service
-        from .event_queue import get_event_queue
-
         logger.info("🔄 Auto-transition processor started")
 
         while self.running:
             try:
                 current_time = time.time()
-                claims_to_remove = []
-
-                for claim_id, transition_info in list(self.transition_queue.items()):
-                    if current_time >= transition_info["next_transition_at"]:
-                        # Time to transition this claim
-                        success = await self._transition_claim(claim_id, transition_info)
-
-                        if success:
-                            current_status = transition_info["current_status"]
-
-                            if current_status == "in_progress":
-                                # Move to review and schedule next transition
-                                transition_info["current_status"] = "review"
-                                transition_info["next_transition_at"] = current_time + 10
-                                logger.info(f"✅ Claim {claim_id} transitioned: in_progress → review")
-
-                            elif current_status == "review":
-                                # Move to completed and remove from queue
-                                transition_info["current_status"] = "completed"
-                                claims_to_remove.append(claim_id)
-                                logger.info(f"✅ Claim {claim_id} transitioned: review → completed")
-                        else:
-                            # Failed to transition, remove from queue
-                            claims_to_remove.append(claim_id)
-                            logger.error(f"❌ Failed to transition claim {claim_id}, removing from queue")
-
-                # Remove completed or failed claims
-                for claim_id in claims_to_remove:
-                    del self.transition_queue[claim_id]
-
-                # Sleep for a bit before checking again
-                await asyncio.sleep(1)
+
+                # Pop every claim that is due this tick
+                ready = []
+                while self.heap and self.heap[0][0] <= current_time:
+                    due_at, claim_id = heapq.heappop(self.heap)
+                    transition_info = self.state.get(claim_id)
+                    if transition_info is None or transition_info.next_transition_at != due_at:
+                        # Stale entry: claim was rescheduled or already finished
+                        continue
+                    ready.append((claim_id, transition_info))
+
+                if ready:
+                    await self._transition_claims(ready, current_time)
+
+                # Sleep until the next claim is due, or until new work is scheduled
+                self._wake.clear()
+                timeout = max(0.0, self.heap[0][0] - time.time()) if self.heap else None
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
 
             except Exception as e:
-                logger.error(f"Error in auto-transition processor: {e}", exc_info=True)
+                logger.error("Error in auto-transition processor: %s", e, exc_info=True)
                 await asyncio.sleep(5)
 
-    async def _transition_claim(self, claim_id: str, transition_info: Dict[str, Any]) -> bool:
+    async def _transition_claims(self, ready: List[Tuple[str, TransitionInfo]], current_time: float):
+        """
+        Transition every due claim with one read and one bulk write per collection
+
+        Args:
+            ready: (claim_id, transition_info) pairs that are due
+            current_time: Time the batch was collected, used to schedule the next transition
+        """
+        mongodb = self._mongodb
+        claims = await mongodb.get_claims_by_ids([claim_id for claim_id, _ in ready])
+
+        claim_updates: Dict[str, Dict[str, Any]] = {}
+        workload_deltas: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+        transitioned = []
+
+        for claim_id, transition_info in ready:
+            plan = self._plan_transition(claim_id, transition_info, claims.get(claim_id))
+            if plan is None:
+                # Failed to transition, remove from queue
+                del self.state[claim_id]
+                logger.error("❌ Failed to transition claim %s, removing from queue", claim_id)
+                continue
+
+            updates, adjuster_id, event = plan
+            claim_updates[claim_id] = updates
+            if adjuster_id:
+                workload_deltas[adjuster_id] = workload_deltas.get(adjuster_id, 0) - 1
+            events.append(event)
+            transitioned.append((claim_id, transition_info))
+
+        if not claim_updates:
+            return
+
+        writes = [mongodb.update_claims_bulk(claim_updates)]
+        if workload_deltas:
+            writes.append(mongodb.update_adjuster_workloads_bulk(workload_deltas))
+        claims_written, *_ = await asyncio.gather(*writes)
+
+        if not claims_written:
+            for claim_id, _ in transitioned:
+                del self.state[claim_id]
+                logger.error("❌ Failed to transition claim %s, removing from queue", claim_id)
+            return
+
+        for adjuster_id in workload_deltas:
+            logger.info("Decremented workload for adjuster %s", adjuster_id)
+
+        notify_data_changed("claims", "adjusters", "fraud")
+
+        for event in events:
+            self._events.publish(event)
+
+        for claim_id, transition_info in transitioned:
+            current_status = transition_info.current_status
+
+            if current_status == "in_progress":
+                # Move to review and schedule next transition
+                transition_info.current_status = "review"
+                transition_info.next_transition_at = current_time + 10
+                heapq.heappush(self.heap, (transition_info.next_transition_at, claim_id))
+                logger.info("✅ Claim %s transitioned: in_progress → review", claim_id)
+
+            elif current_status == "review":
+                # Move to completed and remove from queue
+                transition_info.current_status = "completed"
+                del self.state[claim_id]
+                logger.info("✅ Claim %s transitioned: review → completed", claim_id)
+
+    def _plan_transition(
+        self,
+        claim_id: str,
+        transition_info: TransitionInfo,
+        claim: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[Dict[str, Any], Optional[str], Dict[str, Any]]]:
         """
-        Transition a claim to the next status
+        Work out the next status for a claim without touching the database
 
         Args:
             claim_id: The claim identifier
             transition_info: Information about the current transition state
+            claim: The stored claim, or None if it no longer exists
 
         Returns:
-            True if transition was successful, False otherwise
+            (claim field updates, adjuster ID whose workload to decrement, event) or None if the claim
+            should leave the auto-transition queue
         """
         try:
-            from .mongodb_service import get_mongodb_service
-            from .event_queue import get_event_queue
-
-            mongodb = await get_mongodb_service()
-            event_queue = get_event_queue()
-
-            current_status = transition_info["current_status"]
-            claim_amount = transition_info.get("claim_amount", 0)
-
-            # Get full claim to check complexity
-            claim = await mongodb.get_claim(claim_id)
             if not claim:
-                logger.warning(f"Claim {claim_id} not found, cannot transition")
-                return False
+                logger.warning("Claim %s not found, cannot transition", claim_id)
+                return None
+
+            current_status = transition_info.current_status
+            claim_amount = transition_info.claim_amount
 
             complexity_score = claim.get("complexity_score", 0)
             severity_score = claim.get("severity_score", 0)
@@ -139,21 +238,16 @@ class AutoTransitionService:
                 # Transition to review and assign check ID
                 check_id = f"CHECK-{claim_id}-${claim_amount:.0f}"
 
-                # Update claim status and assign check ID
-                await mongodb.update_claim_status(claim_id, "review")
-                await mongodb.update_claim_field(claim_id, "review_check_id", check_id)
-
-                # Publish event
-                await event_queue.publish({
+                event = {
                     "type": "claim_moved_to_review",
                     "message": f"🔍 Claim {claim_id} moved to review - Check ID: {check_id}",
                     "claim_id": claim_id,
                     "status": "review",
                     "review_check_id": check_id
-                })
+                }
 
-                logger.info(f"📋 Assigned check ID {check_id} to claim {claim_id}")
-                return True
+                logger.info("📋 Assigned check ID %s to claim %s", check_id, claim_id)
+                return {"status": "review", "review_check_id": check_id}, None, event
 
             elif current_status == "review":
                 # Only auto-complete simple claims (< $500 and low complexity)
@@ -164,48 +258,38 @@ class AutoTransitionService:
                 )
 
                 if should_auto_complete:
-                    # Transition to completed
-                    await mongodb.update_claim_status(claim_id, "completed")
-
                     # Decrement adjuster workload (skip AUTO_SYSTEM)
                     routing_decision = claim.get("routing_decision", {})
                     adjuster_id = routing_decision.get("adjuster_id")
-                    if adjuster_id and adjuster_id != "AUTO_SYSTEM":
-                        await mongodb.update_adjuster_workload(adjuster_id, -1)
-                        logger.info(f"Decremented workload for adjuster {adjuster_id}")
+                    if adjuster_id == "AUTO_SYSTEM":
+                        adjuster_id = None
 
-                    # Publish event
-                    await event_queue.publish({
+                    event = {
                         "type": "claim_completed",
                         "message": f"✅ Claim {claim_id} auto-completed (low complexity, <$500)",
                         "claim_id": claim_id,
                         "status": "completed"
-                    })
+                    }
 
-                    logger.info(f"✅ Claim {claim_id} auto-completed (${claim_amount:.0f}, complexity: {complexity_score:.0f})")
-                    return True
+                    logger.info("✅ Claim %s auto-completed ($%.0f, complexity: %.0f)", claim_id, claim_amount, complexity_score)
+                    return {"status": "completed"}, adjuster_id, event
                 else:
                     # Keep in review - requires manual handling
-                    logger.info(f"⏸️  Claim {claim_id} staying in review (${claim_amount:.0f}, complexity: {complexity_score:.0f}, severity: {severity_score:.0f})")
-                    # Return False to remove from auto-transition queue
-                    return False
+                    logger.info("⏸️  Claim %s staying in review ($%.0f, complexity: %.0f, severity: %.0f)", claim_id, claim_amount, complexity_score, severity_score)
+                    # Return None to remove from auto-transition queue
+                    return None
 
             else:
-                logger.warning(f"Unknown status for claim {claim_id}: {current_status}")
-                return False
+                logger.warning("Unknown status for claim %s: %s", claim_id, current_status)
+                return None
 
         except Exception as e:
-            logger.error(f"Failed to transition claim {claim_id}: {e}", exc_info=True)
-            return False
-
-
-# Singleton instance
-_auto_transition_service = None
+            logger.error("Failed to transition claim %s: %s", claim_id, e, exc_info=True)
+            return None
 
 
+# Singleton instance: cached on first call
+@functools.lru_cache(maxsize=1)
 def get_auto_transition_service() -> AutoTransitionService:
     """Get or create the auto-transition service instance"""
-    global _auto_transition_service
-    if _auto_transition_service is None:
-        _auto_transition_service = AutoTransitionService()
-    return _auto_transition_service
+    return AutoTransitionService()
@@ -0,0 +1,26 @@
+"""
+Cache invalidation hooks
+Lets background writers (claim pipeline, auto-transition) drop API response caches
+without importing the API layer
+"""
+
+import logging
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+_listeners: List[Callable[..., None]] = []
+
+
+def register_invalidation_listener(listener: Callable[..., None]):
+    """Register a callable taking cache tags, e.g. the API cache's invalidate"""
+    _listeners.append(listener)
+
+
+def notify_data_changed(*tags: str):
+    """Tell every registered cache that data under these tags changed"""
+    for listener in _listeners:
+        try:
+            listener(*tags)
+        except Exception as e:
+            logger.error(f"Cache invalidation failed for {tags}: {e}")
@@ -4,16 +4,29 @@ Processes claim files immediately upon upload
 """
 
 import os
+import asyncio
+import functools
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Set
 from pathlib import Path
 from datetime import datetime
-import random
-import string
+import itertools
+import secrets
+
+from services.mongodb_service import EXTRACTED_TEXT_PREVIEW_CHARS, SKIP_REPROCESS_STATUSES
 
 logger = logging.getLogger(__name__)
 
+# Cap on claims in flight so an upload burst doesn't fan out into unbounded LLM/LandingAI/Mongo calls
+_PIPELINE_SEM = asyncio.Semaphore(int(os.getenv("CLAIM_PIPELINE_CONCURRENCY", "4")))
+
+# Appended to the random part of claim IDs so IDs minted in the same second can't repeat
+_claim_counter = itertools.count()
+
+# Filename stems being processed right now; catches duplicate upload/Gmail events before the MongoDB lookup
+_processing: Set[str] = set()
+
 
 async def process_claim_file(file_path: str) -> Dict[str, Any]:
     """
@@ -25,8 +38,25 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict with claim_id and processing result
     """
+    source_filename_stem = Path(file_path).stem
+    if source_filename_stem in _processing:
+        logger.info(f"⏭️  Skipping {Path(file_path).name} - already being processed")
+        return {"status": "skipped", "reason": "in_flight"}
+
+    _processing.add(source_filename_stem)
+    try:
+        async with _PIPELINE_SEM:
+            return await _process_claim_file(file_path)
+    finally:
+        _processing.discard(source_filename_stem)
+
+
+async def _process_claim_file(file_path: str) -> Dict[str, Any]:
+    """Run the pipeline for one file; callers go through process_claim_file"""
     try:
         start_time = time.time()
+        # One wall-clock reading per claim keeps its ID and timestamps consistent
+        now = datetime.now()
 
         # Import services
         from .event_queue import get_event_queue
@@ -40,6 +70,7 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         from .auto_processor import get_auto_processor
         from .task_manager import create_claim_task
         from .auto_transition import get_auto_transition_service
+        from .cache_hooks import notify_data_changed
 
         # Get services
         event_queue = get_event_queue()
@@ -69,14 +100,14 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         if existing_claim:
             existing_claim_id = existing_claim.get("claim_id")
             current_status = existing_claim.get("status")
-            if current_status in ["assigned", "in_progress", "review", "completed", "approved", "closed", "auto_approved"]:
+            if current_status in SKIP_REPROCESS_STATUSES:
                 logger.info(f"⏭️  Skipping {full_filename} - already exists as {existing_claim_id} with status: {current_status}")
                 return {"status": "skipped", "reason": f"already_{current_status}", "claim_id": existing_claim_id}
 
         # Generate claim ID
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
-        claim_id = f"CLM-{timestamp}-{random_suffix}"
+        timestamp = now.strftime("%Y%m%d-%H%M%S")
+        suffix = f"{secrets.token_hex(2).upper()}{next(_claim_counter) & 0xFF:02X}"
+        claim_id = f"CLM-{timestamp}-{suffix}"
 
         logger.info(f"✅ Generated claim ID: {claim_id}")
 
@@ -91,7 +122,7 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             }
 
         # Publish upload event
-        await event_queue.publish({
+        event_queue.publish({
             "type": "claim_uploaded",
             "message": f"📤 New claim uploaded: {claim_id}",
             "claim_id": claim_id,
@@ -107,13 +138,14 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             "status": "extracting",
             "document_types": [],
             "file_paths": [file_path],
-            "created_at": datetime.now()
+            "created_at": now
         }
         await mongodb.save_claim(initial_claim)
+        notify_data_changed("claims")
         logger.info(f"💾 Saved initial claim to MongoDB")
 
         # Publish extraction event
-        await event_queue.publish({
+        event_queue.publish({
             "type": "claim_status_update",
             "message": f"📄 Extracting document data: {claim_id}",
             "claim_id": claim_id,
@@ -129,6 +161,7 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         if not document_text:
             logger.error(f"❌ No text extracted from {full_filename}")
             await mongodb.update_claim_status(claim_id, "error")
+            notify_data_changed("claims")
             return {"status": "error", "error": "No text extracted", "claim_id": claim_id}
 
         logger.info(f"✅ Extracted {len(document_text)} characters")
@@ -137,64 +170,15 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         logger.info(f"🧠 Parsing claim data with GPT-4o...")
         claim_data = await _parse_claim_data(document_text, extracted)
 
-        # Add to fallback RAG service (in-memory cache)
-        # Note: Pathway RAG will also automatically index this file since it's in uploads/
-        try:
-            rag_service.add_document(
-                claim_id=claim_id,
-                document_text=document_text,
-                metadata={
-                    "claim_id": claim_id,
-                    "document_type": extracted.get("document_type", "unknown"),
-                    "file_path": file_path,
-                    "processed_at": datetime.now().isoformat()
-                }
-            )
-            logger.info(f"✅ Added to fallback RAG service")
-            logger.info(f"📁 File saved in {file_path} - Pathway RAG will auto-index")
-        except Exception as e:
-            logger.warning(f"Failed to add to fallback RAG: {e}")
-
-        # Add to document context
-        try:
-            context_mgr.add_context(
-                claim_id=claim_id,
-                raw_text=document_text,
-                structured_data=claim_data,
-                document_type=extracted.get("document_type", "unknown"),
-                file_path=file_path,
-                tables=extracted.get("tables", [])
-            )
-            logger.info(f"✅ Added to document context")
-        except Exception as e:
-            logger.warning(f"Failed to add to context: {e}")
-
-        # Update with extracted data
-        await mongodb.save_claim({
-            "claim_id": claim_id,
-            "source_filename": source_filename_stem,
-            "status": "scoring",
-            "extracted_data": claim_data,
-            "extracted_text": document_text,
-            "file_paths": [file_path]
-        })
-
-        # Publish scoring event
-        await event_queue.publish({
+        # Publish scoring and fraud detection events (both stages run concurrently below)
+        event_queue.publish({
             "type": "claim_status_update",
             "message": f"📊 Analyzing claim severity and complexity: {claim_id}",
             "claim_id": claim_id,
             "status": "scoring",
             "stage": "scoring"
         })
-
-        # Score claim
-        logger.info(f"📊 Scoring claim...")
-        scores = await scorer.score_claim(claim_data)
-        logger.info(f"✅ Scores - Severity: {scores['severity_score']:.1f}, Complexity: {scores['complexity_score']:.1f}")
-
-        # Publish fraud detection event
-        await event_queue.publish({
+        event_queue.publish({
             "type": "claim_status_update",
             "message": f"🔍 Running fraud detection: {claim_id}",
             "claim_id": claim_id,
@@ -202,27 +186,27 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             "stage": "fraud_detection"
         })
 
-        # Detect fraud
+        # Score claim (pure CPU, sub-millisecond: run inline)
+        logger.info(f"📊 Scoring claim...")
+        scores = scorer.score_claim(claim_data)
+
+        # Detect fraud, index the document, store its full text and fetch adjusters concurrently:
+        # each stage only depends on the parsed claim data and document text
         logger.info(f"🔍 Detecting fraud patterns...")
-        fraud_flags = await fraud_detector.detect_fraud_flags(claim_data, document_text)
+        fraud_flags, _, _, _, adjusters = await asyncio.gather(
+            fraud_detector.detect_fraud_flags(claim_data, document_text),
+            asyncio.to_thread(_add_to_rag, rag_service, claim_id, document_text, extracted, file_path, now),
+            asyncio.to_thread(_add_to_context, context_mgr, claim_id, document_text, claim_data, extracted, file_path),
+            mongodb.save_claim_text(claim_id, document_text),
+            mongodb.get_all_adjusters(available_only=True)
+        )
+        logger.info(f"✅ Scores - Severity: {scores['severity_score']:.1f}, Complexity: {scores['complexity_score']:.1f}")
 
         if fraud_flags:
             logger.warning(f"⚠️  {len(fraud_flags)} fraud flag(s) detected")
 
-        # Update with scores
-        await mongodb.save_claim({
-            "claim_id": claim_id,
-            "source_filename": source_filename_stem,
-            "status": "routing",
-            "extracted_data": claim_data,
-            "severity_score": scores["severity_score"],
-            "complexity_score": scores["complexity_score"],
-            "fraud_flags": fraud_flags,
-            "file_paths": [file_path]
-        })
-
         # Publish routing event
-        await event_queue.publish({
+        event_queue.publish({
             "type": "claim_status_update",
             "message": f"🎯 Finding optimal adjuster: {claim_id}",
             "claim_id": claim_id,
@@ -230,9 +214,6 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             "stage": "routing"
         })
 
-        # Get adjusters
-        adjusters = await mongodb.get_all_adjusters(available_only=True)
-
         # Check auto-processing
         logger.info(f"🤖 Checking auto-processing eligibility...")
         auto_check = auto_processor.should_auto_process(
@@ -245,7 +226,7 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         if auto_check["should_auto_process"]:
             logger.info(f"🤖 Auto-processing: {auto_check['reason']}")
 
-            await event_queue.publish({
+            event_queue.publish({
                 "type": "claim_status_update",
                 "message": f"🤖 Auto-processing: {auto_check['reason']}",
                 "claim_id": claim_id,
@@ -278,7 +259,27 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         processing_time = time.time() - start_time
         final_status = "in_progress" if routing_decision.get("adjuster_id") else "routing"
 
-        # Save final claim
+        # Create task first so its ID goes out with the final claim write
+        task_id = None
+        if routing_decision.get("adjuster_id"):
+            try:
+                task_id = await create_claim_task(
+                    claim_id=claim_id,
+                    adjuster_id=routing_decision.get("adjuster_id"),
+                    adjuster_name=routing_decision.get("assigned_to"),
+                    claim_amount=claim_data.get("claim_amount"),
+                    incident_type=claim_data.get("incident_type"),
+                    priority=routing_decision.get("priority", "medium"),
+                    is_auto_approved=routing_decision.get("auto_processed", False)
+                )
+                if task_id:
+                    logger.info(f"📋 Created task {task_id}")
+            except Exception as e:
+                logger.warning(f"Failed to create task: {e}")
+        task_created = bool(task_id)
+
+        # Save final claim: the only write after the initial insert
+        # (full text stored separately, claim keeps a short preview)
         full_claim = {
             "claim_id": claim_id,
             "source_filename": source_filename_stem,
@@ -287,6 +288,9 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             "document_types": [extracted.get("document_type", "unknown")],
             "file_paths": [file_path],
             "extracted_data": claim_data,
+            "extracted_text_ref": claim_id,
+            "extracted_text_preview": document_text[:EXTRACTED_TEXT_PREVIEW_CHARS],
+            "extracted_text_length": len(document_text),
             "severity_score": scores["severity_score"],
             "complexity_score": scores["complexity_score"],
             "fraud_flags": fraud_flags,
@@ -294,8 +298,16 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             "status": final_status,
             "processing_time_seconds": processing_time,
         }
+        if task_id:
+            full_claim["task_id"] = task_id
 
-        await mongodb.save_claim(full_claim)
+        # Update adjuster workload alongside the claim write
+        writes = [mongodb.save_claim(full_claim)]
+        adjuster_id = routing_decision.get("adjuster_id")
+        if adjuster_id and adjuster_id != "AUTO_SYSTEM":
+            writes.append(mongodb.update_adjuster_workload(adjuster_id, 1))
+        await asyncio.gather(*writes)
+        notify_data_changed("claims", "adjusters", "fraud")
 
         # Schedule auto-transition
         if final_status == "in_progress":
@@ -306,38 +318,12 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
             )
             logger.info(f"📅 Scheduled auto-transition")
 
-        # Update adjuster workload
-        adjuster_id = routing_decision.get("adjuster_id")
-        if adjuster_id and adjuster_id != "AUTO_SYSTEM":
-            await mongodb.update_adjuster_workload(adjuster_id, 1)
-
-        # Create task
-        task_created = False
-        if routing_decision.get("adjuster_id"):
-            try:
-                task_id = await create_claim_task(
-                    claim_id=claim_id,
-                    adjuster_id=routing_decision.get("adjuster_id"),
-                    adjuster_name=routing_decision.get("assigned_to"),
-                    claim_amount=claim_data.get("claim_amount"),
-                    incident_type=claim_data.get("incident_type"),
-                    priority=routing_decision.get("priority", "medium"),
-                    is_auto_approved=routing_decision.get("auto_processed", False)
-                )
-
-                if task_id:
-                    task_created = True
-                    await mongodb.update_claim_field(claim_id, "task_id", task_id)
-                    logger.info(f"📋 Created task {task_id}")
-            except Exception as e:
-                logger.warning(f"Failed to create task: {e}")
-
         # Publish completion
         message = f"✅ Claim processed: {claim_id} → {routing_decision.get('assigned_to', 'Unassigned')}"
         if task_created:
             message += " (Task created)"
 
-        await event_queue.publish({
+        event_queue.publish({
             "type": "claim_processed",
             "message": message,
             "claim_id": claim_id,
@@ -364,39 +350,128 @@ async def process_claim_file(file_path: str) -> Dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
+def _add_to_rag(rag_service, claim_id: str, document_text: str, extracted: Dict, file_path: str, processed_at: datetime):
+    """Add to fallback RAG service (in-memory cache)"""
+    # Note: Pathway RAG will also automatically index this file since it's in uploads/
+    try:
+        rag_service.add_document(
+            claim_id=claim_id,
+            document_text=document_text,
+            metadata={
+                "claim_id": claim_id,
+                "document_type": extracted.get("document_type", "unknown"),
+                "file_path": file_path,
+                "processed_at": processed_at.isoformat()
+            }
+        )
+        logger.info(f"✅ Added to fallback RAG service")
+        logger.info(f"📁 File saved in {file_path} - Pathway RAG will auto-index")
+    except Exception as e:
+        logger.warning(f"Failed to add to fallback RAG: {e}")
+
+
+def _add_to_context(context_mgr, claim_id: str, document_text: str, claim_data: Dict, extracted: Dict, file_path: str):
+    """Add to document context"""
+    try:
+        context_mgr.add_context(
+            claim_id=claim_id,
+            raw_text=document_text,
+            structured_data=claim_data,
+            document_type=extracted.get("document_type", "unknown"),
+            file_path=file_path,
+            tables=extracted.get("tables", [])
+        )
+        logger.info(f"✅ Added to document context")
+    except Exception as e:
+        logger.warning(f"Failed to add to context: {e}")
+
+
+# Static instructions go in the system message so the prompt prefix is identical (and cacheable) across claims
+CLAIM_EXTRACTION_PROMPT = (
+    "Extract claim information from the insurance claim document in the user message. "
+    "Use null for any value the document does not state. Dates are YYYY-MM-DD."
+)
+
+
+def _nullable(type_name: str) -> Dict[str, Any]:
+    return {"type": [type_name, "null"]}
+
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Strict structured outputs require every property listed and no extras"""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+# Validated server-side by OpenAI structured outputs
+CLAIM_JSON_SCHEMA = _strict_object({
+    "claim_number": _nullable("string"),
+    "policy_number": _nullable("string"),
+    "claim_amount": _nullable("number"),
+    "incident_type": {"type": "string", "enum": ["auto", "property", "injury", "commercial", "liability"]},
+    "incident_date": _nullable("string"),
+    "report_date": _nullable("string"),
+    "parties": {
+        "type": "array",
+        "items": _strict_object({
+            "name": {"type": "string"},
+            "role": {"type": "string", "enum": ["claimant", "insured", "third_party"]}
+        })
+    },
+    "location": _strict_object({
+        "city": _nullable("string"),
+        "state": _nullable("string")
+    }),
+    "injuries": {
+        "type": "array",
+        "items": _strict_object({
+            "person": {"type": "string"},
+            "severity": {"type": "string", "enum": ["minor", "moderate", "serious", "critical", "fatal"]},
+            "description": {"type": "string"}
+        })
+    },
+    "description": {"type": "string"},
+    "fault_determination": {"type": "string", "enum": ["clear", "disputed", "multi-party"]},
+    "attorney_involved": {"type": "boolean"}
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client():
+    """Shared async OpenAI client, so every claim reuses one connection pool"""
+    import openai
+    return openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=2, timeout=30)
+
+
+async def close_openai_client():
+    """Close the shared OpenAI client if it was created"""
+    if _get_openai_client.cache_info().currsize:
+        await _get_openai_client().close()
+        _get_openai_client.cache_clear()
+
+
 async def _parse_claim_data(document_text: str, extracted: Dict) -> Dict:
     """Parse extracted text into structured claim data using GPT-4o"""
-    import openai
     import json
 
     try:
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-        prompt = f"""Extract claim information from this document and return as JSON:
-
-{document_text[:3000]}
-
-Return JSON with these fields:
-{{
-  "claim_number": str (the claim number from document) or null,
-  "policy_number": str (policy number) or null,
-  "claim_amount": float or null,
-  "incident_type": "auto" | "property" | "injury" | "commercial" | "liability",
-  "incident_date": "YYYY-MM-DD" or null,
-  "report_date": "YYYY-MM-DD" or null,
-  "parties": [{{"name": str, "role": "claimant"|"insured"|"third_party"}}],
-  "location": {{"city": str, "state": str}},
-  "injuries": [{{"person": str, "severity": "minor"|"moderate"|"serious"|"critical"|"fatal", "description": str}}],
-  "description": str,
-  "fault_determination": "clear" | "disputed" | "multi-party",
-  "attorney_involved": bool
-}}"""
-
-        response = client.chat.completions.create(
+        client = _get_openai_client()
+
+        response = await client.chat.completions.create(
             model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            response_format={"type": "json_object"}
+            messages=[
+                {"role": "system", "content": CLAIM_EXTRACTION_PROMPT},
+                {"role": "user", "content": document_text[:3000]}
+            ],
+            temperature=0,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "claim", "schema": CLAIM_JSON_SCHEMA, "strict": True}
+            }
         )
 
         claim_data = json.loads(response.choices[0].message.content)
@@ -3,6 +3,7 @@ Claim Scoring Service
 Calculates severity and complexity scores for claims
 """
 
+import re
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -10,13 +11,38 @@ from datetime import datetime, timedelta
 logger = logging.getLogger(__name__)
 
 
+def keyword_pattern(*words: str) -> re.Pattern:
+    """Compile a keyword bucket into one alternation, anchored at a word start (so "accident" isn't a "dent")"""
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + ")")
+
+
+# Severity keyword buckets
+_GLASS_RE = keyword_pattern("glass", "windshield", "window")
+_MINOR_CLAIM_RE = keyword_pattern("minor", "scratch", "dent")
+_MAJOR_CLAIM_RE = keyword_pattern("major", "total loss")
+_INJURY_RE = keyword_pattern("injury", "injured", "hurt", "pain", "medical")
+_TOTAL_LOSS_RE = keyword_pattern("total loss", "destroyed", "catastrophic", "totaled")
+_MAJOR_DAMAGE_RE = keyword_pattern("major", "significant", "extensive", "severe")
+_MODERATE_DAMAGE_RE = keyword_pattern("moderate", "substantial")
+_MINOR_DAMAGE_RE = keyword_pattern("minor", "small", "light")
+_COSMETIC_DAMAGE_RE = keyword_pattern("glass", "windshield", "scratch", "dent")
+
+# Complexity keyword buckets
+_MULTI_PARTY_RE = keyword_pattern("multi", "multiple", "several")
+_DISPUTED_RE = keyword_pattern("disputed", "unclear", "contested", "disagreement")
+_CLEAR_FAULT_RE = keyword_pattern("clear", "obvious", "straightforward")
+_ATTORNEY_RE = keyword_pattern("attorney", "lawyer", "legal counsel", "representation")
+_GLASS_TYPE_RE = keyword_pattern("glass", "windshield")
+_COMMERCIAL_RE = keyword_pattern("commercial", "business")
+
+
 class ClaimScorer:
     """Score claims based on severity and complexity"""
 
     def __init__(self):
         pass
 
-    async def score_claim(self, claim_data: Dict[str, Any]) -> Dict[str, float]:
+    def score_claim(self, claim_data: Dict[str, Any]) -> Dict[str, float]:
         """
         Score a claim on severity and complexity
 
@@ -24,8 +50,9 @@ class ClaimScorer:
             Dict with severity_score, complexity_score (0-100)
         """
         try:
-            severity_score = await self._calculate_severity(claim_data)
-            complexity_score = await self._calculate_complexity(claim_data)
+            description = claim_data.get("description", "").lower()
+            severity_score = self._calculate_severity(claim_data, description)
+            complexity_score = self._calculate_complexity(claim_data, description)
 
             logger.info(f"Claim scored - Severity: {severity_score:.1f}, Complexity: {complexity_score:.1f}")
 
@@ -41,7 +68,7 @@ class ClaimScorer:
                 "complexity_score": 50.0
             }
 
-    async def _calculate_severity(self, claim_data: Dict[str, Any]) -> float:
+    def _calculate_severity(self, claim_data: Dict[str, Any], description: str) -> float:
         """
         Calculate severity score (0-100)
 
@@ -56,12 +83,11 @@ class ClaimScorer:
         claim_amount = claim_data.get("claim_amount") or 0
         if claim_amount == 0:
             # Try to infer from description
-            description = claim_data.get("description", "").lower()
-            if any(word in description for word in ["glass", "windshield", "window"]):
+            if _GLASS_RE.search(description):
                 claim_amount = 300  # Typical glass claim
-            elif any(word in description for word in ["minor", "scratch", "dent"]):
+            elif _MINOR_CLAIM_RE.search(description):
                 claim_amount = 1500  # Minor damage
-            elif any(word in description for word in ["major", "total loss"]):
+            elif _MAJOR_CLAIM_RE.search(description):
                 claim_amount = 15000  # Major damage
             else:
                 claim_amount = 5000  # Default moderate claim
@@ -83,8 +109,7 @@ class ClaimScorer:
         injuries = claim_data.get("injuries", [])
         if not injuries:
             # Check description for injury keywords
-            description = claim_data.get("description", "").lower()
-            if any(word in description for word in ["injury", "injured", "hurt", "pain", "medical"]):
+            if _INJURY_RE.search(description):
                 score += 15  # Possible injury mentioned
             else:
                 score += 0  # Property only
@@ -100,23 +125,22 @@ class ClaimScorer:
                 score += 40
 
         # Property damage (20 points)
-        description = claim_data.get("description", "").lower()
-        if any(word in description for word in ["total loss", "destroyed", "catastrophic", "totaled"]):
+        if _TOTAL_LOSS_RE.search(description):
             score += 20
-        elif any(word in description for word in ["major", "significant", "extensive", "severe"]):
+        elif _MAJOR_DAMAGE_RE.search(description):
             score += 15
-        elif any(word in description for word in ["moderate", "substantial"]):
+        elif _MODERATE_DAMAGE_RE.search(description):
             score += 10
-        elif any(word in description for word in ["minor", "small", "light"]):
+        elif _MINOR_DAMAGE_RE.search(description):
             score += 5
-        elif any(word in description for word in ["glass", "windshield", "scratch", "dent"]):
+        elif _COSMETIC_DAMAGE_RE.search(description):
             score += 3
         else:
             score += 8  # Default moderate
 
         return min(score, 100.0)
 
-    async def _calculate_complexity(self, claim_data: Dict[str, Any]) -> float:
+    def _calculate_complexity(self, claim_data: Dict[str, Any], description: str) -> float:
         """
         Calculate complexity score (0-100)
 
@@ -128,13 +152,12 @@ class ClaimScorer:
         - Commercial vs personal lines
         """
         score = 0.0
-        description = claim_data.get("description", "").lower()
 
         # Number of parties (20 points)
         parties = claim_data.get("parties", [])
         if len(parties) == 0:
             # Infer from description
-            if any(word in description for word in ["multi", "multiple", "several"]):
+            if _MULTI_PARTY_RE.search(description):
                 score += 15
             else:
                 score += 5  # Simple single party
@@ -149,9 +172,9 @@ class ClaimScorer:
         fault = claim_data.get("fault_determination", "").lower()
         if not fault:
             # Infer from description
-            if any(word in description for word in ["disputed", "unclear", "contested", "disagreement"]):
+            if _DISPUTED_RE.search(description):
                 score += 20
-            elif any(word in description for word in ["clear", "obvious", "straightforward"]):
+            elif _CLEAR_FAULT_RE.search(description):
                 score += 5
             else:
                 score += 10  # Default moderate
@@ -166,7 +189,7 @@ class ClaimScorer:
         attorney_involved = claim_data.get("attorney_involved", False)
         if not attorney_involved:
             # Check description for attorney mentions
-            if any(word in description for word in ["attorney", "lawyer", "legal counsel", "representation"]):
+            if _ATTORNEY_RE.search(description):
                 score += 20
         else:
             score += 20
@@ -183,9 +206,9 @@ class ClaimScorer:
             score += 3  # Very simple
         else:
             # Infer from description
-            if any(word in description for word in ["glass", "windshield"]):
+            if _GLASS_TYPE_RE.search(description):
                 score += 3
-            elif any(word in description for word in ["commercial", "business"]):
+            elif _COMMERCIAL_RE.search(description):
                 score += 20
             else:
                 score += 8
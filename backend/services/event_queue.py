@@ -4,7 +4,9 @@ Event queue for real-time updates via Server-Sent Events (SSE)
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -12,35 +14,116 @@ logger = logging.getLogger(__name__)
 class EventQueue:
     """Simple in-memory event queue for SSE"""
 
-    def __init__(self):
-        self.subscribers = []
+    def __init__(self, max_queue_size: int = 256, max_dropped: int = 16, max_pending: int = 1024):
+        # Each subscriber gets a bounded queue; value is the number of events dropped for it
+        self.subscribers: Dict[asyncio.Queue, int] = {}
+        self.max_queue_size = max_queue_size
+        self.max_dropped = max_dropped
+        self.max_pending = max_pending
+
+        # Published events wait here until the dispatcher fans them out
+        self._pending: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
-    async def publish(self, event: Dict[str, Any]):
-        """Publish event to all subscribers"""
+    def publish(self, event: Dict[str, Any]):
+        """Queue event for all subscribers without waiting on delivery"""
         logger.info(f"Publishing event: {event.get('type')}")
 
-        # Add to all subscriber queues
-        for queue in self.subscribers:
+        # Callers on another thread or another thread's loop (e.g. the Pathway pipeline) hand off to the server loop
+        running_loop = self._running_loop()
+        if self._loop is not None and self._loop.is_running() and running_loop is not self._loop:
+            self._loop.call_soon_threadsafe(self.publish, event)
+            return
+
+        if running_loop is None:
+            logger.warning(f"No event loop to publish on, dropping event: {event.get('type')}")
+            return
+
+        self._ensure_dispatcher()
+        try:
+            self._pending.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(f"Event queue full, dropping event: {event.get('type')}")
+
+    def publish_threadsafe(self, event: Dict[str, Any]):
+        """Publish from a thread that isn't running the server's event loop"""
+        if self._loop is None or self._loop.is_closed():
+            # start() hasn't run on the server loop yet (or it has shut down)
+            logger.warning(f"Event queue not started, dropping event: {event.get('type')}")
+            return
+        self._loop.call_soon_threadsafe(self.publish, event)
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def start(self):
+        """Bind to the running server loop so other threads can publish from startup on"""
+        self._ensure_dispatcher()
+
+    def _ensure_dispatcher(self):
+        """Start the fan-out task on the running loop if it isn't already running"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._loop = asyncio.get_running_loop()
+            self._pending = asyncio.Queue(maxsize=self.max_pending)
+            self._dispatcher = self._loop.create_task(self._dispatch())
+
+    async def _dispatch(self):
+        """Drain published events in batches and fan them out to subscribers"""
+        while True:
+            events = [await self._pending.get()]
+            while not self._pending.empty():
+                events.append(self._pending.get_nowait())
+
+            for event in events:
+                self._broadcast(event)
+
+    def _broadcast(self, event: Dict[str, Any]):
+        """Deliver one event to every subscriber queue"""
+        # Serialize once per event rather than once per subscriber
+        try:
+            event_data = orjson.dumps(event, default=str).decode()
+        except Exception as e:
+            logger.error(f"Failed to serialize event: {e}")
+            return
+
+        # Add to all subscriber queues without waiting on slow consumers
+        for queue in list(self.subscribers):
             try:
-                await queue.put(event)
+                queue.put_nowait(event_data)
+            except asyncio.QueueFull:
+                self.subscribers[queue] += 1
             except Exception as e:
                 logger.error(f"Failed to publish to subscriber: {e}")
 
-    async def subscribe(self) -> Dict[str, Any]:
-        """Subscribe to events (returns next event)"""
-        queue = asyncio.Queue()
-        self.subscribers.append(queue)
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new subscriber and return its bounded queue of serialized events"""
+        self._ensure_dispatcher()
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.subscribers[queue] = 0
+        return queue
 
-        try:
-            # Wait for next event with timeout for heartbeat
-            event = await asyncio.wait_for(queue.get(), timeout=30.0)
-            return event
-        except asyncio.TimeoutError:
-            # Send heartbeat
-            return {"type": "heartbeat", "message": "keep-alive"}
-        finally:
-            # Note: In production, would need proper cleanup when client disconnects
-            pass
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber queue"""
+        self.subscribers.pop(queue, None)
+
+    def is_slow(self, queue: asyncio.Queue) -> bool:
+        """True once a subscriber has dropped more events than allowed"""
+        return self.subscribers.get(queue, 0) > self.max_dropped
+
+    async def stop(self):
+        """Stop the dispatcher task"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
 
 
 # Singleton instance
@@ -8,6 +8,8 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import re
 
+from models.claim import FraudFlagType
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,13 +17,15 @@ class FraudDetector:
     """Detect fraud indicators in claims"""
 
     def __init__(self):
-        # Suspicious keywords for pattern matching
+        # Suspicious keywords for pattern matching (compiled once, reused for every claim)
         self.suspicious_patterns = [
-            r"pre-existing",
-            r"previous.*accident",
-            r"similar.*claim",
-            r"multiple.*injuries",
-            r"witness.*unavailable",
+            re.compile(pattern) for pattern in (
+                r"pre-existing",
+                r"previous.*accident",
+                r"similar.*claim",
+                r"multiple.*injuries",
+                r"witness.*unavailable",
+            )
         ]
 
     async def detect_fraud_flags(self, claim_data: Dict[str, Any], document_text: str) -> List[Dict[str, Any]]:
@@ -83,7 +87,7 @@ class FraudDetector:
             if days_delayed > 14:
                 confidence = min(0.3 + (days_delayed - 14) * 0.02, 0.95)
                 return {
-                    "type": "late_reporting",
+                    "type": FraudFlagType.LATE_REPORTING.value,
                     "confidence": confidence,
                     "evidence": f"Claim reported {days_delayed} days after incident (threshold: 14 days)",
                     "severity": "high" if days_delayed > 30 else "medium"
@@ -113,7 +117,7 @@ class FraudDetector:
             for word1, word2 in contradictions:
                 if word1 in description and word2 in doc_text_lower:
                     flags.append({
-                        "type": "inconsistent_story",
+                        "type": FraudFlagType.INCONSISTENT_STORY.value,
                         "confidence": 0.6,
                         "evidence": f"Contradicting statements found: '{word1}' vs '{word2}'",
                         "severity": "medium"
@@ -132,11 +136,11 @@ class FraudDetector:
             text_lower = document_text.lower()
 
             for pattern in self.suspicious_patterns:
-                if re.search(pattern, text_lower):
+                if pattern.search(text_lower):
                     flags.append({
-                        "type": "suspicious_pattern",
+                        "type": FraudFlagType.SUSPICIOUS_PATTERN.value,
                         "confidence": 0.5,
-                        "evidence": f"Suspicious pattern detected: {pattern}",
+                        "evidence": f"Suspicious pattern detected: {pattern.pattern}",
                         "severity": "low"
                     })
 
@@ -161,7 +165,7 @@ class FraudDetector:
 
             if injuries and all_soft_tissue:
                 flags.append({
-                    "type": "soft_tissue_only",
+                    "type": FraudFlagType.SOFT_TISSUE_ONLY.value,
                     "confidence": 0.4,
                     "evidence": "Only soft tissue injuries reported (difficult to verify)",
                     "severity": "low"
@@ -170,7 +174,7 @@ class FraudDetector:
             # Excessive number of injuries for incident type
             if len(injuries) > 5:
                 flags.append({
-                    "type": "excessive_injuries",
+                    "type": FraudFlagType.EXCESSIVE_INJURIES.value,
                     "confidence": 0.5,
                     "evidence": f"{len(injuries)} injuries reported (unusually high)",
                     "severity": "medium"
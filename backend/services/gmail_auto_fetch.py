@@ -126,7 +126,8 @@ class GmailAutoFetchService:
             logger.info(f"📧 Fetching claim emails (max: {self.max_results}, days back: {self.days_back})...")
 
             # Fetch emails
-            emails = gmail_service.fetch_claim_emails(
+            emails = await gmail_service.run(
+                gmail_service.fetch_claim_emails,
                 max_results=self.max_results,
                 days_back=self.days_back
             )
@@ -172,7 +173,7 @@ class GmailAutoFetchService:
                         claim_ids.append(claim_id)
 
                         # Mark email as read
-                        gmail_service.mark_as_read(email['id'])
+                        await gmail_service.run(gmail_service.mark_as_read, email['id'])
 
                         logger.info(f"✅ Auto-processed email to claim: {claim_id}")
 
@@ -186,7 +187,7 @@ class GmailAutoFetchService:
             self.total_fetched += processed_count
 
             # Publish SSE event
-            await event_queue.publish({
+            event_queue.publish({
                 "type": "gmail_auto_fetch",
                 "message": f"📧 Auto-fetched {processed_count} of {len(emails)} claim emails",
                 "emails_found": len(emails),
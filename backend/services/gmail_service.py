@@ -3,9 +3,12 @@ Gmail Service using LangChain GmailToolkit for automatic authentication
 """
 
 import os
+import asyncio
+import functools
 import logging
 import base64
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, TypeVar
 from pathlib import Path
 
 from langchain_community.agent_toolkits import GmailToolkit
@@ -14,6 +17,8 @@ from googleapiclient.errors import HttpError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class GmailService:
     """Handle Gmail operations using LangChain's GmailToolkit"""
@@ -27,6 +32,9 @@ class GmailService:
     def __init__(self):
         self.toolkit = None
         self.api_resource = None
+        self._user_email: Optional[str] = None
+        # The API resource's httplib2 transport isn't thread-safe, so every call goes through one worker thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmail")
         self._initialize()
 
     def _initialize(self):
@@ -60,6 +68,11 @@ class GmailService:
             logger.error(f"Failed to initialize Gmail toolkit: {e}", exc_info=True)
             logger.warning("Make sure credentials.json and token.json are in the backend directory")
 
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking Gmail API call off the event loop, serialized on the service's worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
     def is_connected(self) -> bool:
         """Check if Gmail is connected"""
         return self.toolkit is not None and self.api_resource is not None
@@ -70,8 +83,11 @@ class GmailService:
             if not self.is_connected():
                 return None
 
-            profile = self.api_resource.users().getProfile(userId='me').execute()
-            return profile.get('emailAddress')
+            # The authenticated account never changes for this client, so look it up once
+            if self._user_email is None:
+                profile = self.api_resource.users().getProfile(userId='me').execute()
+                self._user_email = profile.get('emailAddress')
+            return self._user_email
         except Exception as e:
             logger.error(f"Failed to get user email: {e}")
             return None
@@ -276,33 +292,33 @@ class GmailService:
             logger.error(f"Failed to mark message as read: {e}")
             return False
 
+    def _get_or_create_label_id(self, label: str) -> str:
+        """Look up a label ID by name, creating the label if it doesn't exist"""
+        labels = self.api_resource.users().labels().list(userId='me').execute()
+
+        for lbl in labels.get('labels', []):
+            if lbl['name'].upper() == label.upper():
+                return lbl['id']
+
+        # Create label
+        label_object = {
+            'name': label,
+            'messageListVisibility': 'show',
+            'labelListVisibility': 'labelShow'
+        }
+        created_label = self.api_resource.users().labels().create(
+            userId='me',
+            body=label_object
+        ).execute()
+        return created_label['id']
+
     def add_label(self, message_id: str, label: str) -> bool:
         """Add label to email"""
         try:
             if not self.is_connected():
                 return False
 
-            # Check if custom label exists, create if not
-            labels = self.api_resource.users().labels().list(userId='me').execute()
-            label_id = None
-
-            for lbl in labels.get('labels', []):
-                if lbl['name'].upper() == label.upper():
-                    label_id = lbl['id']
-                    break
-
-            if not label_id:
-                # Create label
-                label_object = {
-                    'name': label,
-                    'messageListVisibility': 'show',
-                    'labelListVisibility': 'labelShow'
-                }
-                created_label = self.api_resource.users().labels().create(
-                    userId='me',
-                    body=label_object
-                ).execute()
-                label_id = created_label['id']
+            label_id = self._get_or_create_label_id(label)
 
             # Add label to message
             self.api_resource.users().messages().modify(
@@ -318,6 +334,30 @@ class GmailService:
             logger.error(f"Failed to add label: {e}")
             return False
 
+    def mark_processed(self, message_ids: List[str], label: str) -> bool:
+        """Mark emails as read and add a label in a single batchModify call"""
+        try:
+            if not self.is_connected() or not message_ids:
+                return False
+
+            label_id = self._get_or_create_label_id(label)
+
+            self.api_resource.users().messages().batchModify(
+                userId='me',
+                body={
+                    'ids': message_ids,
+                    'addLabelIds': [label_id],
+                    'removeLabelIds': ['UNREAD']
+                }
+            ).execute()
+
+            logger.info(f"Marked {len(message_ids)} messages as read with label '{label}'")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to mark messages as processed: {e}")
+            return False
+
 
 # Singleton instance
 _gmail_service: Optional[GmailService] = None
@@ -3,13 +3,24 @@ MongoDB service for claims storage and retrieval
 """
 
 import os
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 
 logger = logging.getLogger(__name__)
 
+# Raw extracted text lives in claim_texts; older documents may still carry it inline
+CLAIM_PROJECTION = {"_id": 0, "extracted_text": 0}
+
+# Characters of extracted text kept on the claim document for list views
+EXTRACTED_TEXT_PREVIEW_CHARS = 300
+
+# Claims in these statuses are never re-processed on re-upload or when the watcher sees the file again
+SKIP_REPROCESS_STATUSES = frozenset({"assigned", "in_progress", "review", "completed", "approved", "closed", "auto_approved", "auto_routed"})
+
 
 class MongoDBService:
     """Service for managing claims data in MongoDB"""
@@ -23,19 +34,36 @@ class MongoDBService:
     async def connect(self):
         """Connect to MongoDB"""
         try:
-            self.client = AsyncIOMotorClient(self.connection_string)
+            # Keep a warm pool so the first requests don't each pay socket + auth setup
+            self.client = AsyncIOMotorClient(
+                self.connection_string,
+                minPoolSize=int(os.getenv("MONGO_MIN_POOL", "10")),
+                maxPoolSize=int(os.getenv("MONGO_MAX_POOL", "100")),
+                # Compress wire traffic; large extracted_text fields shrink well
+                compressors=os.getenv("MONGO_COMPRESSORS", "zstd,snappy,zlib")
+            )
             self.db = self.client[self.database_name]
+            await self.client.admin.command("ping")
+
+            # Create indexes (independent, so issue them together)
+            await asyncio.gather(
+                self.db.claims.create_index("claim_id", unique=True),
+                self.db.claims.create_index("created_at"),
+                # List/filter hot paths: newest-first by status, per adjuster, by source
+                self.db.claims.create_index([("status", 1), ("created_at", -1)], background=True),
+                self.db.claims.create_index([("routing_decision.adjuster_id", 1), ("status", 1)], background=True),
+                self.db.claims.create_index([("source", 1), ("created_at", -1)], background=True),
 
-            # Create indexes
-            await self.db.claims.create_index("claim_id", unique=True)
-            await self.db.claims.create_index("status")
-            await self.db.claims.create_index("created_at")
+                self.db.adjusters.create_index("adjuster_id", unique=True),
+                self.db.adjusters.create_index("available"),
 
-            await self.db.adjusters.create_index("adjuster_id", unique=True)
-            await self.db.adjusters.create_index("available")
+                self.db.routing_history.create_index("claim_id"),
+                self.db.routing_history.create_index("adjuster_id"),
 
-            await self.db.routing_history.create_index("claim_id")
-            await self.db.routing_history.create_index("adjuster_id")
+                self.db.claim_texts.create_index("claim_id", unique=True),
+            )
+
+            await self.backfill_text_previews()
 
             logger.info(f"Connected to MongoDB: {self.database_name}")
 
@@ -43,6 +71,22 @@ class MongoDBService:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
 
+    async def backfill_text_previews(self):
+        """Give legacy claims with inline extracted_text the preview fields CLAIM_PROJECTION leaves for list views"""
+        try:
+            result = await self.db.claims.update_many(
+                {"extracted_text": {"$type": "string"}, "extracted_text_preview": {"$exists": False}},
+                [{"$set": {
+                    "extracted_text_preview": {"$substrCP": ["$extracted_text", 0, EXTRACTED_TEXT_PREVIEW_CHARS]},
+                    "extracted_text_length": {"$strLenCP": "$extracted_text"}
+                }}]
+            )
+            if result.modified_count:
+                logger.info(f"Backfilled text previews on {result.modified_count} legacy claims")
+
+        except Exception as e:
+            logger.error(f"Failed to backfill text previews: {e}")
+
     async def close(self):
         """Close MongoDB connection"""
         if self.client is not None:
@@ -70,13 +114,42 @@ class MongoDBService:
     async def get_claim(self, claim_id: str) -> Optional[Dict[str, Any]]:
         """Get claim by ID"""
         try:
-            claim = await self.db.claims.find_one({"claim_id": claim_id}, {"_id": 0})
+            claim = await self.db.claims.find_one({"claim_id": claim_id}, CLAIM_PROJECTION)
             return claim
 
         except Exception as e:
             logger.error(f"Failed to get claim: {e}")
             return None
 
+    async def save_claim_text(self, claim_id: str, text: str) -> bool:
+        """Save the raw extracted text for a claim, kept out of the claims collection"""
+        try:
+            await self.db.claim_texts.update_one(
+                {"claim_id": claim_id},
+                {"$set": {"claim_id": claim_id, "text": text, "updated_at": datetime.now()}},
+                upsert=True
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save claim text: {e}")
+            return False
+
+    async def get_claim_text(self, claim_id: str) -> Optional[str]:
+        """Get the raw extracted text for a claim"""
+        try:
+            doc = await self.db.claim_texts.find_one({"claim_id": claim_id}, {"_id": 0, "text": 1})
+            if doc:
+                return doc.get("text")
+
+            # Claims saved before the text moved out still carry it inline
+            legacy = await self.db.claims.find_one({"claim_id": claim_id}, {"_id": 0, "extracted_text": 1})
+            return legacy.get("extracted_text") if legacy else None
+
+        except Exception as e:
+            logger.error(f"Failed to get claim text: {e}")
+            return None
+
     async def get_claim_by_filename(self, source_filename: str) -> Optional[Dict[str, Any]]:
         """Get claim by source filename"""
         try:
@@ -98,13 +171,52 @@ class MongoDBService:
             if status:
                 query["status"] = status
 
-            claims = await self.db.claims.find(query, {"_id": 0}).sort("created_at", -1).to_list(length=None)
+            claims = await self.db.claims.find(query, CLAIM_PROJECTION).sort("created_at", -1).to_list(length=None)
             return claims
 
         except Exception as e:
             logger.error(f"Failed to get claims: {e}", exc_info=False)
             return []
 
+    async def stream_claims(self, status: Optional[str] = None, batch_size: int = 200) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate claims newest-first without materializing the full result list"""
+        if self.client is None or self.db is None:
+            logger.warning("MongoDB not connected, returning no claims")
+            return
+
+        query = {}
+        if status:
+            query["status"] = status
+
+        cursor = self.db.claims.find(query, CLAIM_PROJECTION).sort("created_at", -1).batch_size(batch_size)
+        async for claim in cursor:
+            yield claim
+
+    async def count_claims(self, status: Optional[str] = None) -> int:
+        """Count claims, optionally filtered by status"""
+        if self.client is None or self.db is None:
+            logger.warning("MongoDB not connected, returning zero count")
+            return 0
+
+        if status:
+            return await self.db.claims.count_documents({"status": status})
+        # Collection metadata read, no scan
+        return await self.db.claims.estimated_document_count()
+
+    async def get_claims_by_adjuster(self, adjuster_id: str, status: Optional[str] = "assigned") -> List[Dict[str, Any]]:
+        """Get claim IDs routed to an adjuster, optionally filtered by status"""
+        try:
+            query = {"routing_decision.adjuster_id": adjuster_id}
+            if status:
+                query["status"] = status
+
+            claims = await self.db.claims.find(query, {"_id": 0, "claim_id": 1}).to_list(length=None)
+            return claims
+
+        except Exception as e:
+            logger.error(f"Failed to get claims for adjuster: {e}")
+            return []
+
     async def get_claims_queue(self) -> List[Dict[str, Any]]:
         """Get claims in triage queue (not yet assigned)"""
         try:
@@ -123,6 +235,7 @@ class MongoDBService:
         """Delete claim"""
         try:
             await self.db.claims.delete_one({"claim_id": claim_id})
+            await self.db.claim_texts.delete_one({"claim_id": claim_id})
             logger.info(f"Deleted claim: {claim_id}")
             return True
 
@@ -158,6 +271,47 @@ class MongoDBService:
             logger.error(f"Failed to update claim field: {e}")
             return False
 
+    async def update_claim_fields(self, claim_id: str, fields: Dict[str, Any]) -> bool:
+        """Update several claim fields in one round trip"""
+        try:
+            result = await self.db.claims.update_one(
+                {"claim_id": claim_id},
+                {"$set": {**fields, "updated_at": datetime.now()}}
+            )
+            logger.info(f"Updated claim {claim_id} fields {', '.join(fields)}")
+            return result.modified_count > 0
+
+        except Exception as e:
+            logger.error(f"Failed to update claim fields: {e}")
+            return False
+
+    async def get_claims_by_ids(self, claim_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several claims in one query, keyed by claim ID"""
+        try:
+            cursor = self.db.claims.find({"claim_id": {"$in": claim_ids}}, CLAIM_PROJECTION)
+            return {claim["claim_id"]: claim async for claim in cursor}
+
+        except Exception as e:
+            logger.error(f"Failed to get claims: {e}")
+            return {}
+
+    async def update_claims_bulk(self, updates: Dict[str, Dict[str, Any]]) -> bool:
+        """Apply a set of field updates per claim in one round trip"""
+        try:
+            now = datetime.now()
+            operations = [
+                UpdateOne({"claim_id": claim_id}, {"$set": {**fields, "updated_at": now}})
+                for claim_id, fields in updates.items()
+            ]
+
+            await self.db.claims.bulk_write(operations, ordered=False)
+            logger.info(f"Updated {len(operations)} claims")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to update claims: {e}")
+            return False
+
     # Adjuster operations
     async def save_adjuster(self, adjuster_data: Dict[str, Any]) -> bool:
         """Save or update adjuster profile"""
@@ -176,6 +330,27 @@ class MongoDBService:
             logger.error(f"Failed to save adjuster: {e}")
             return False
 
+    async def save_adjusters_bulk(self, adjusters: List[Dict[str, Any]]) -> bool:
+        """Save or update many adjuster profiles in one round trip"""
+        try:
+            now = datetime.now()
+            operations = [
+                UpdateOne(
+                    {"adjuster_id": adjuster["adjuster_id"]},
+                    {"$set": {**adjuster, "updated_at": now}},
+                    upsert=True
+                )
+                for adjuster in adjusters
+            ]
+
+            await self.db.adjusters.bulk_write(operations, ordered=False)
+            logger.info(f"Saved {len(operations)} adjusters")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save adjusters: {e}")
+            return False
+
     async def get_adjuster(self, adjuster_id: str) -> Optional[Dict[str, Any]]:
         """Get adjuster by ID"""
         try:
@@ -217,6 +392,21 @@ class MongoDBService:
             logger.error(f"Failed to update adjuster workload: {e}")
             return False
 
+    async def update_adjuster_workloads_bulk(self, workload_deltas: Dict[str, int]) -> bool:
+        """Update several adjusters' current workload in one round trip"""
+        try:
+            operations = [
+                UpdateOne({"adjuster_id": adjuster_id}, {"$inc": {"current_workload": delta}})
+                for adjuster_id, delta in workload_deltas.items()
+            ]
+
+            await self.db.adjusters.bulk_write(operations, ordered=False)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to update adjuster workloads: {e}")
+            return False
+
     # Routing history
     async def save_routing_decision(self, routing_data: Dict[str, Any]) -> bool:
         """Save routing decision to history"""
@@ -10,6 +10,8 @@ import threading
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from services.mongodb_service import EXTRACTED_TEXT_PREVIEW_CHARS, SKIP_REPROCESS_STATUSES
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -157,7 +159,7 @@ class PathwayPipeline:
                         existing_claim_id = existing_claim.get("claim_id")
                         current_status = existing_claim.get("status")
                         # Don't reprocess claims that are already assigned or beyond
-                        if current_status in ["assigned", "in_progress", "review", "completed", "approved", "closed", "auto_approved", "auto_routed"]:
+                        if current_status in SKIP_REPROCESS_STATUSES:
                             logger.info(f"⏭️  Skipping {full_filename} - already exists as {existing_claim_id} with status: {current_status}")
                             return {"status": "skipped", "reason": f"already_in_status_{current_status}"}
                         else:
@@ -179,12 +181,12 @@ class PathwayPipeline:
                     # Publish event with final claim ID
                     event_queue = get_event_queue()
                     try:
-                        loop.run_until_complete(event_queue.publish({
+                        event_queue.publish_threadsafe({
                             "type": "claim_uploaded",
                             "message": f"📤 New claim uploaded: {claim_id}",
                             "claim_id": claim_id,
                             "status": "uploaded"
-                        }))
+                        })
                     except:
                         pass
 
@@ -215,13 +217,13 @@ class PathwayPipeline:
 
                     # Publish extraction start event
                     try:
-                        loop.run_until_complete(event_queue.publish({
+                        event_queue.publish_threadsafe({
                             "type": "claim_status_update",
                             "message": f"📄 Extracting document data: {claim_id}",
                             "claim_id": claim_id,
                             "status": "extracting",
                             "stage": "extraction"
-                        }))
+                        })
                     except:
                         pass
 
@@ -280,44 +282,47 @@ class PathwayPipeline:
                     except Exception as e:
                         logger.warning(f"Failed to add to document context: {e}")
 
-                    # Update claim with extracted data and status
+                    # Update claim with extracted data and status (LandingAI text stored separately)
+                    mongodb.save_claim_text(claim_id, document_text)
                     mongodb.save_claim({
                         "claim_id": claim_id,
                         "source_filename": source_filename_stem,
                         "status": "scoring",
                         "extracted_data": claim_data,
-                        "extracted_text": document_text,  # Store LandingAI extracted text
+                        "extracted_text_ref": claim_id,
+                        "extracted_text_preview": document_text[:EXTRACTED_TEXT_PREVIEW_CHARS],
+                        "extracted_text_length": len(document_text),
                         "file_paths": [file_path]
                     })
                     logger.info(f"💾 Updated claim with extracted data")
 
                     # Publish scoring event
                     try:
-                        loop.run_until_complete(event_queue.publish({
+                        event_queue.publish_threadsafe({
                             "type": "claim_status_update",
                             "message": f"📊 Analyzing claim severity and complexity: {claim_id}",
                             "claim_id": claim_id,
                             "status": "scoring",
                             "stage": "scoring"
-                        }))
+                        })
                     except:
                         pass
 
                     # Score claim
                     scorer = get_claim_scorer()
-                    scores = loop.run_until_complete(scorer.score_claim(claim_data))
+                    scores = scorer.score_claim(claim_data)
 
                     logger.info(f"✅ Scores - Severity: {scores['severity_score']:.1f}, Complexity: {scores['complexity_score']:.1f}")
 
                     # Publish fraud detection event
                     try:
-                        loop.run_until_complete(event_queue.publish({
+                        event_queue.publish_threadsafe({
                             "type": "claim_status_update",
                             "message": f"🔍 Running fraud detection analysis: {claim_id}",
                             "claim_id": claim_id,
                             "status": "scoring",
                             "stage": "fraud_detection"
-                        }))
+                        })
                     except:
                         pass
 
@@ -343,13 +348,13 @@ class PathwayPipeline:
 
                     # Publish routing event
                     try:
-                        loop.run_until_complete(event_queue.publish({
+                        event_queue.publish_threadsafe({
                             "type": "claim_status_update",
                             "message": f"🎯 Finding optimal adjuster match: {claim_id}",
                             "claim_id": claim_id,
                             "status": "routing",
                             "stage": "routing"
-                        }))
+                        })
                     except:
                         pass
 
@@ -371,13 +376,13 @@ class PathwayPipeline:
 
                         # Publish auto-processing event
                         try:
-                            loop.run_until_complete(event_queue.publish({
+                            event_queue.publish_threadsafe({
                                 "type": "claim_status_update",
                                 "message": f"🤖 Auto-processing: {auto_check['reason']}",
                                 "claim_id": claim_id,
                                 "status": "routing",
                                 "stage": "auto_processing"
-                            }))
+                            })
                         except:
                             pass
 
@@ -486,7 +491,7 @@ class PathwayPipeline:
                         if task_created:
                             message += " (Task created)"
 
-                        loop.run_until_complete(event_queue.publish({
+                        event_queue.publish_threadsafe({
                             "type": "claim_processed",
                             "message": message,
                             "claim_id": claim_id,
@@ -496,7 +501,7 @@ class PathwayPipeline:
                             "severity_score": scores["severity_score"],
                             "complexity_score": scores["complexity_score"],
                             "task_created": task_created
-                        }))
+                        })
                     except:
                         pass
 
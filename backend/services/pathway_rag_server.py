@@ -4,6 +4,7 @@ Provides automatic file watching, vector embedding, and question answering
 """
 
 import os
+import asyncio
 import logging
 import threading
 from typing import Optional
@@ -54,6 +55,8 @@ class PathwayRAGServer:
         self.embedder_model = embedder_model
         self.llm_model = llm_model
         self.running = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
 
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -209,6 +212,39 @@ Answer:"""
             self.running = False
             raise
 
+    def run_in_thread(self) -> threading.Thread:
+        """
+        Start run() on a background thread that owns its own asyncio loop
+
+        Pathway's async UDFs (embedder, LLM) schedule onto the thread's loop,
+        so they never touch the API server's loop. pw.run() has no stop hook,
+        so the thread stays a daemon and ends with the process.
+        """
+        def _rag_worker():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.run()
+            finally:
+                self.loop.close()
+
+        self.thread = threading.Thread(
+            target=_rag_worker,
+            daemon=True,
+            name="PathwayRAGServer"
+        )
+        self.thread.start()
+        return self.thread
+
+    def mark_unavailable(self):
+        """
+        Make query() refuse new questions during shutdown
+
+        This does not stop the worker thread: pw.run() has no stop hook, so the
+        daemon thread keeps serving until the process exits.
+        """
+        self.running = False
+
     async def query(self, question: str) -> dict:
         """
         Query the RAG system (for internal use)
@@ -277,10 +277,12 @@ class PDFGenerator:
             Path to generated PDF or None if failed
         """
         try:
-            # Create safe filename
+            # Create safe filename; the message ID keeps same-subject emails converted in the same second
+            # (PDFs are generated concurrently) from writing to the same path
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            safe_id = "".join(c for c in message_id if c.isalnum())
             safe_subject = "".join(c for c in subject if c.isalnum() or c in (' ', '-', '_'))[:50]
-            filename = f"{timestamp}_gmail_{safe_subject.replace(' ', '_')}.pdf"
+            filename = f"{timestamp}_gmail_{safe_id}_{safe_subject.replace(' ', '_')}.pdf"
             output_path = output_dir / filename
 
             # Prepare email data
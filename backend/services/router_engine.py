@@ -165,9 +165,16 @@ class RouterEngine:
         """Select best adjuster from qualified list"""
         incident_type = claim_data.get("incident_type", "").lower()
 
-        # Score each adjuster
-        scored_adjusters = []
-        for adjuster in qualified_adjusters:
+        # Same for every adjuster, so work out the points per experience level once
+        combined_score = (severity_score + complexity_score) / 2
+        if combined_score >= 70:
+            experience_points = {"senior": 30, "expert": 30, "mid": 25}
+        elif combined_score >= 50:
+            experience_points = {"mid": 25, "senior": 25, "expert": 25}
+        else:
+            experience_points = {"junior": 20, "mid": 20}
+
+        def score(adjuster: Dict[str, Any]) -> float:
             score = 0.0
 
             # Specialization match (40 points)
@@ -178,26 +185,17 @@ class RouterEngine:
                 score += 20
 
             # Experience level (30 points)
-            experience_level = adjuster.get("experience_level", "junior")
-            combined_score = (severity_score + complexity_score) / 2
-            if combined_score >= 70 and experience_level in ["senior", "expert"]:
-                score += 30
-            elif combined_score >= 50 and experience_level in ["mid", "senior", "expert"]:
-                score += 25
-            elif combined_score < 50 and experience_level in ["junior", "mid"]:
-                score += 20
+            score += experience_points.get(adjuster.get("experience_level", "junior"), 0)
 
             # Workload (30 points) - prefer less busy adjusters
             current_workload = adjuster.get("current_workload", 0)
             max_workload = adjuster.get("max_concurrent_claims", 15)
-            workload_ratio = current_workload / max_workload
-            score += (30 * (1 - workload_ratio))
+            score += 30 * (1 - current_workload / max_workload)
 
-            scored_adjusters.append((score, adjuster))
+            return score
 
-        # Return highest scoring adjuster
-        scored_adjusters.sort(key=lambda x: x[0], reverse=True)
-        return scored_adjusters[0][1]
+        # Return highest scoring adjuster (first one wins ties, as with a stable sort)
+        return max(qualified_adjusters, key=score)
 
     def _generate_routing_reason(
         self,
@@ -55,10 +55,25 @@ class SyncMongoDBService:
             logger.error(f"Failed to save claim: {e}", exc_info=True)
             return False
 
+    def save_claim_text(self, claim_id: str, text: str) -> bool:
+        """Save the raw extracted text for a claim, kept out of the claims collection"""
+        try:
+            self.db.claim_texts.update_one(
+                {"claim_id": claim_id},
+                {"$set": {"claim_id": claim_id, "text": text, "updated_at": datetime.now()}},
+                upsert=True
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save claim text: {e}")
+            return False
+
     def delete_claim(self, claim_id: str) -> bool:
         """Delete a claim"""
         try:
             result = self.db.claims.delete_one({"claim_id": claim_id})
+            self.db.claim_texts.delete_one({"claim_id": claim_id})
             logger.info(f"Deleted claim: {claim_id}")
             return result.deleted_count > 0
 
@@ -65,14 +65,14 @@ export const ClaimsQueue: React.FC = () => {
     setTextError(null);
 
     try {
-      // First try to get from the claim's extracted_text field
-      if (selectedClaim?.extracted_text) {
-        setProcessedText(selectedClaim.extracted_text);
-        setTextLoading(false);
+      // First try the claim's stored extracted text
+      const textResponse = await fetch(`${API_BASE}/api/claims/${claimId}/text`);
+      if (textResponse.ok) {
+        setProcessedText(await textResponse.text());
         return;
       }
 
-      // If not available, try the API endpoint
+      // If not available, try the document context
       const response = await fetch(`${API_BASE}/api/chat/processed-data/${claimId}`);
 
       if (response.ok) {
@@ -411,7 +411,7 @@ export const ClaimsQueue: React.FC = () => {
                 </div>
 
                 {/* LandingAI Processed Data */}
-                {selectedClaim.extracted_text && (
+                {selectedClaim.extracted_text_preview && (
                   <div className="bg-blue-50 p-4 rounded-xl border border-blue-200">
                     <h4 className="font-semibold text-sm text-blue-800 mb-2 flex items-center gap-2">
                       <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -421,15 +421,15 @@ export const ClaimsQueue: React.FC = () => {
                     </h4>
                     <div className="bg-white rounded-lg p-3 max-h-32 overflow-y-auto">
                       <p className="text-xs text-gray-600 leading-relaxed whitespace-pre-wrap">
-                        {selectedClaim.extracted_text.substring(0, 300)}
-                        {selectedClaim.extracted_text.length > 300 && '...'}
+                        {selectedClaim.extracted_text_preview}
+                        {(selectedClaim.extracted_text_length ?? 0) > selectedClaim.extracted_text_preview.length && '...'}
                       </p>
                     </div>
                     <div className="mt-2 flex items-center gap-2 text-xs text-blue-600">
                       <svg className="w-3 h-3" fill="currentColor" viewBox="0 0 20 20">
                         <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm1-12a1 1 0 10-2 0v4a1 1 0 00.293.707l2.828 2.829a1 1 0 101.415-1.415L11 9.586V6z" clipRule="evenodd" />
                       </svg>
-                      <span>Extracted: {selectedClaim.extracted_text.length} characters</span>
+                      <span>Extracted: {selectedClaim.extracted_text_length ?? selectedClaim.extracted_text_preview.length} characters</span>
                     </div>
                   </div>
                 )}
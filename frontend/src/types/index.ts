@@ -5,7 +5,8 @@ export interface Claim {
   file_paths?: string[];
   document_types?: string[];
   extracted_data?: ExtractedData;
-  extracted_text?: string;
+  extracted_text_preview?: string;
+  extracted_text_length?: number;
   severity_score?: number;
   complexity_score?: number;
   fraud_flags: FraudFlag[];